@@ -1,7 +1,53 @@
-from .api import __all__ as api_all
-from .configs import __all__ as configs_all
-from .core import __all__ as core_all
-from .crawler import __all__ as crawler_all
-from .modules import __all__ as modules_all
+import importlib
 
-__all__ = api_all + configs_all + core_all + crawler_all + modules_all  # type: ignore
+# Subpackage -> names it exports. Subpackages are imported on first attribute
+# access (PEP 562), so importing the package does not load quart, aio_pika,
+# redis or selenium until one of their users is actually needed.
+_EXPORTS = {
+    "api": ("create_app", "crawl", "get_result"),
+    "configs": (
+        "ConfigLoader",
+        "ConfigFileNotFoundError",
+        "ConfigFileFormatError",
+        "ConfigLoaderException",
+    ),
+    "core": (
+        "RabbitMQPublisher",
+        "RabbitMQMessageError",
+        "RabbitMQConnectionError",
+        "RabbitMQPublisherError",
+        "RedisManager",
+        "RedisManagerError",
+        "ResultProcessor",
+        "TaskManager",
+        "TaskData",
+        "TaskManagerError",
+        "TaskNotFoundError",
+        "InvalidTaskDataError",
+    ),
+    "crawler": ("Crawler", "TikTokLibraryParser"),
+    "modules": (
+        "AlertDestination",
+        "AlertHandler",
+        "ExceptionHandler",
+        "LogLevel",
+        "LogLevelException",
+        "LogLevelValidationError",
+        "Logger",
+        "LoggerError",
+        "LoggerConfigError",
+        "LoggerFileError",
+    ),
+}
+_SOURCES = {name: package for package, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_SOURCES)
+
+
+def __getattr__(name: str):
+    package = _SOURCES.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{package}", __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,6 @@
 from quart import Quart
 from api.routes import routes
+from modules.alert_handler import AlertHandler
 
 
 def create_app():
@@ -12,4 +13,10 @@ def create_app():
 
     # Register the routes blueprint
     app.register_blueprint(routes)
+
+    @app.after_serving
+    async def close_alert_session():
+        """Closes the shared alert HTTP session when the app stops serving."""
+        await AlertHandler.close_session()
+
     return app
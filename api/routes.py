@@ -7,6 +7,7 @@ from modules.exception_handler import ExceptionHandler
 
 routes = Blueprint("routes", __name__)
 
+# Process-wide clients; main.py hands the same instances to the crawler
 RABBIT_PUBLISHER = RabbitMQPublisher("configs/rabbitmq.yaml")
 REDIS_MANAGER = RedisManager("configs/config.yaml")
 CONFIG = ConfigLoader.load_config("configs/config.yaml")
@@ -14,6 +15,10 @@ DEFAULT_REGION = CONFIG.get(
     "default_region", "BE"
 )  # Default to "BE" (Belgium) if not configured
 
+# Bound once to skip attribute lookups on every request
+_publish = RABBIT_PUBLISHER.publish
+_set_status = REDIS_MANAGER.set_status
+
 
 @routes.before_app_serving
 async def init_connections():
@@ -21,8 +26,10 @@ async def init_connections():
     Runs once before the Quart app starts serving requests.
     Ensures RabbitMQ and Redis connections are initialized.
     """
-    await RABBIT_PUBLISHER.connect()
-    await REDIS_MANAGER.connect()
+    if not RABBIT_PUBLISHER.connected:
+        await RABBIT_PUBLISHER.connect()
+    if not REDIS_MANAGER.connected:
+        await REDIS_MANAGER.connect()
 
 
 @routes.route("/crawl", methods=["POST"])
@@ -34,19 +41,20 @@ async def crawl():
     if not data or "keyword" not in data:
         return jsonify({"error": "Missing 'keyword' in request body"}), 400
 
+    keyword = data["keyword"]
     region = data.get("region", DEFAULT_REGION)
     task_id = str(uuid.uuid4())
 
     try:
-        await RABBIT_PUBLISHER.publish(
+        await _publish(
             queue="crawler.task",
-            message={"task_id": task_id, "keyword": data["keyword"], "region": region},
+            message={"task_id": task_id, "keyword": keyword, "region": region},
         )
-        await REDIS_MANAGER.set_status(
+        await _set_status(
             task_id,
             {
                 "status": "queued",
-                "keyword": data["keyword"],
+                "keyword": keyword,
                 "region": region,
                 "result": None,
             },
@@ -1,4 +1,11 @@
 import yaml
+from functools import lru_cache
+
+try:
+    # libyaml-backed loader is much faster than the pure-Python one
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader  # type: ignore
 
 
 class ConfigLoaderException(Exception):
@@ -31,10 +38,14 @@ class ConfigLoader:
     """
 
     @staticmethod
+    @lru_cache(maxsize=32)
     def load_config(file_path: str) -> dict:
         """
         Loads a YAML configuration file.
 
+        Parsed configurations are cached per path, so repeated loads of the same
+        file are free. The returned dictionary is shared and must not be mutated.
+
         :param file_path: Path to the YAML file.
         :return: Configuration as a dictionary.
         :raises ConfigFileNotFoundError: If the file does not exist.
@@ -42,7 +53,7 @@ class ConfigLoader:
         """
         try:
             with open(file_path, "r") as file:
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=_Loader)
         except FileNotFoundError:
             raise ConfigFileNotFoundError(file_path)
         except yaml.YAMLError as e:
@@ -1,8 +1,13 @@
-import json
+import asyncio
 import aio_pika
+from contextlib import suppress
 from configs.config_loader import ConfigLoader
 from modules.logger import Logger, LogLevel
 from modules.exception_handler import ExceptionHandler
+from utils.serialization import dumps
+
+# Resolved once instead of an enum attribute lookup per published message
+_PERSISTENT = aio_pika.DeliveryMode.PERSISTENT
 
 
 class RabbitMQPublisherError(Exception):
@@ -37,6 +42,16 @@ class RabbitMQPublisher:
         self.logger = Logger
         self.logger.configure_logger(name="RabbitMQPublisher", level=LogLevel.INFO)
         self.exception_handler = ExceptionHandler()
+        self.connection: aio_pika.abc.AbstractRobustConnection | None = None
+        self.channel: aio_pika.abc.AbstractChannel | None = None
+        # Queues declared on the current connection; declaring is idempotent
+        # but costs a broker round-trip, so each queue is declared only once
+        self._declared: dict[str, aio_pika.abc.AbstractQueue] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has opened a channel and declared the default queue."""
+        return self.channel is not None
 
     async def _ensure_channel_initialized(self) -> None:
         """
@@ -44,7 +59,7 @@ class RabbitMQPublisher:
 
         :raise RabbitMQConnectionError: In case if channel is 'None'.
         """
-        if not hasattr(self, "channel") or not self.channel:
+        if not self.channel:
             await self.connect()
 
     async def connect(self):
@@ -55,15 +70,64 @@ class RabbitMQPublisher:
             self.connection = await aio_pika.connect_robust(
                 f"amqp://{self.username}:{self.password}@{self.host}/"
             )
-            self.channel = await self.connection.channel()
-            await self.channel.declare_queue(self.queue, durable=True)
+            # Publishes are confirmed by the broker; unroutable returns are
+            # not raised, since messages go to queues declared up front
+            self.channel = await self.connection.channel(
+                publisher_confirms=True, on_return_raises=False
+            )
+            self._declared.clear()
+            await self.declare_queues(self.queue)
             self.logger.log_info(
-                f"Connected to RabbitMQ at {self.host}, queue '{self.queue}' initialized."
+                "Connected to RabbitMQ at %s, queue '%s' initialized.",
+                self.host,
+                self.queue,
             )
         except Exception as e:
-            self.logger.log_error(f"Failed to connect to RabbitMQ: {e}")
+            self.logger.log_error("Failed to connect to RabbitMQ: %s", e)
+            # A half-open connection must not count as connected, or callers
+            # checking `connected` would never retry
+            connection, self.connection, self.channel = self.connection, None, None
+            if connection is not None:
+                with suppress(Exception):
+                    await connection.close()
             raise RabbitMQConnectionError("Could not connect to RabbitMQ.") from e
 
+    async def declare_queues(self, *queues: str) -> list[aio_pika.abc.AbstractQueue]:
+        """
+        Declares durable queues on the current channel, concurrently, and
+        returns their queue objects. Queues already declared on this
+        connection are returned from the cache without a broker round-trip.
+
+        :param queues: Names of the queues.
+        :return: Queue objects in the order of ``queues``.
+        """
+        await self._ensure_channel_initialized()
+        missing = [
+            queue for queue in dict.fromkeys(queues) if queue not in self._declared
+        ]
+        if missing:
+            declared = await asyncio.gather(
+                *(self.channel.declare_queue(queue, durable=True) for queue in missing)
+            )
+            self._declared.update(zip(missing, declared))
+        return [self._declared[queue] for queue in queues]
+
+    async def open_channel(self, prefetch_count: int) -> aio_pika.abc.AbstractChannel:
+        """
+        Opens a channel for a consumer on the shared connection.
+
+        Acks and QoS are scoped to a channel, so each consumer gets its own:
+        a cumulative ack or a prefetch limit cannot touch another consumer's
+        deliveries. Publisher confirms stay on the publishing channel.
+
+        :param prefetch_count: Unacked deliveries the broker may push to the channel.
+        :return: The new channel.
+        """
+        await self._ensure_channel_initialized()
+        channel = await self.connection.channel()
+        await channel.set_qos(prefetch_count=prefetch_count)
+        return channel
+
     async def send_task(self, task_id: str, keyword: str) -> None:
         """
         Publishes a task message to the RabbitMQ queue asynchronously.
@@ -76,16 +140,19 @@ class RabbitMQPublisher:
             message = {"task_id": task_id, "keyword": keyword}
             await self.channel.default_exchange.publish(
                 aio_pika.Message(
-                    body=json.dumps(message).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    body=dumps(message),
+                    delivery_mode=_PERSISTENT,
                 ),
                 routing_key=self.queue,
             )
             self.logger.log_info(
-                f"Task {task_id} with keyword '{keyword}' sent to queue '{self.queue}'."
+                "Task %s with keyword '%s' sent to queue '%s'.",
+                task_id,
+                keyword,
+                self.queue,
             )
         except Exception as e:
-            self.logger.log_error(f"Failed to send task {task_id} to RabbitMQ: {e}")
+            self.logger.log_error("Failed to send task %s to RabbitMQ: %s", task_id, e)
             self.exception_handler.handle_exception(
                 e, {"task_id": task_id, "keyword": keyword}
             )
@@ -102,17 +169,18 @@ class RabbitMQPublisher:
         """
         try:
             await self._ensure_channel_initialized()
-            await self.channel.declare_queue(queue, durable=True)
+            if queue not in self._declared:
+                await self.declare_queues(queue)
             await self.channel.default_exchange.publish(
                 aio_pika.Message(
-                    body=json.dumps(message).encode(),
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                    body=dumps(message),
+                    delivery_mode=_PERSISTENT,
                 ),
                 routing_key=queue,
             )
-            self.logger.log_info(f"Message sent to queue '{queue}': {message}")
+            self.logger.log_info("Message sent to queue '%s': %s", queue, message)
         except Exception as e:
-            self.logger.log_error(f"Failed to publish message to RabbitMQ: {e}")
+            self.logger.log_error("Failed to publish message to RabbitMQ: %s", e)
             self.exception_handler.handle_exception(
                 e, {"queue": queue, "message": message}
             )
@@ -127,5 +195,5 @@ class RabbitMQPublisher:
                 await self.connection.close()
                 self.logger.log_info("RabbitMQ connection closed.")
         except Exception as e:
-            self.logger.log_error(f"Failed to close RabbitMQ connection: {e}")
+            self.logger.log_error("Failed to close RabbitMQ connection: %s", e)
             raise RabbitMQPublisherError("Error closing RabbitMQ connection.") from e
@@ -1,10 +1,69 @@
-import json
+import sys
 import redis.asyncio as redis
+from contextlib import suppress
+from redis.exceptions import NoScriptError, ResponseError
 from configs.config_loader import ConfigLoader
 from utils.types import TaskData
+from utils.serialization import dumps, loads
 from modules.logger import Logger, LogLevel
 from modules.exception_handler import ExceptionHandler
 
+REDIS_MAX_CONNECTIONS = 16
+REDIS_POOL_TIMEOUT = 5
+REDIS_HEALTH_CHECK_INTERVAL = 30
+
+# Sets the status and result fields of a stored task in one server-side step,
+# without creating a partial hash for a task that does not exist. A task still
+# stored as a JSON string by an earlier version is converted to a hash first.
+# Returns 0 if the task does not exist.
+UPDATE_STATUS_SCRIPT = """
+local kind = redis.call('TYPE', KEYS[1]).ok
+if kind == 'none' then
+    return 0
+end
+if kind == 'string' then
+    local task = cjson.decode(redis.call('GET', KEYS[1]))
+    redis.call('DEL', KEYS[1])
+    redis.call('HSET', KEYS[1], 'keyword', task.keyword, 'region', cjson.encode(task.region))
+end
+redis.call('HSET', KEYS[1], 'status', ARGV[1], 'result', ARGV[2])
+return 1
+"""
+
+# Lua scripts registered with SCRIPT LOAD on connect, by name
+SCRIPTS = {"update_status": UPDATE_STATUS_SCRIPT}
+
+
+def _encode_task(task_data: TaskData) -> dict:
+    """
+    Maps TaskData to the fields of its Redis hash.
+
+    'status' and 'keyword' are stored as plain strings; the nullable 'region'
+    and 'result' are stored as JSON, so every field is always present.
+    """
+    return {
+        "status": task_data["status"],
+        "keyword": task_data["keyword"],
+        "region": dumps(task_data.get("region")),
+        "result": dumps(task_data.get("result")),
+    }
+
+
+def _decode_task(fields: dict[bytes, bytes]) -> dict:
+    """
+    Maps the fields of a task's Redis hash back to TaskData.
+
+    'status' and 'region' come from small sets of values, so they are interned:
+    decoded tasks share one string object per value.
+    """
+    region = loads(fields[b"region"])
+    return {
+        "status": sys.intern(fields[b"status"].decode()),
+        "keyword": fields[b"keyword"].decode(),
+        "region": sys.intern(region) if isinstance(region, str) else region,
+        "result": loads(fields[b"result"]),
+    }
+
 
 class RedisManagerError(Exception):
     """Custom exception for RedisManager."""
@@ -20,25 +79,91 @@ class RedisManager:
         self.host = config.get("host", "localhost")
         self.port = config.get("port", 6379)
         self.db = config.get("db", 0)
+        self.max_connections = config.get("max_connections", REDIS_MAX_CONNECTIONS)
 
         self.logger = Logger
         self.logger.configure_logger(name="RedisManager", level=LogLevel.INFO)
         self.exception_handler = ExceptionHandler()
         self.redis_client: redis.Redis | None = None
+        # Script name -> SHA-1 returned by SCRIPT LOAD
+        self._scripts: dict[str, str] = {}
+
+    @property
+    def connected(self) -> bool:
+        """Whether connect() has reached the server and loaded the scripts."""
+        return self.redis_client is not None
 
     async def connect(self) -> None:
         """Asynchronously connects to the Redis server."""
         try:
-            self.redis_client = redis.Redis(
-                host=self.host, port=self.port, db=self.db, decode_responses=True
+            # A bounded pool: bursts of concurrent commands wait for a free
+            # connection (up to REDIS_POOL_TIMEOUT) instead of opening more
+            # sockets. Values are stored as JSON bytes and decoded straight
+            # from bytes, so responses are not decoded to str.
+            pool = redis.BlockingConnectionPool(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                max_connections=self.max_connections,
+                timeout=REDIS_POOL_TIMEOUT,
+                socket_keepalive=True,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
             )
+            self.redis_client = redis.Redis.from_pool(pool)
             # Check the connection
             await self.redis_client.ping()
+            await self._load_scripts()
             self.logger.log_info("Connected to Redis successfully.")
         except Exception as e:
             self.logger.log_error("Failed to connect to Redis.")
+            # A client that failed its handshake must not count as connected,
+            # or callers checking `connected` would never retry
+            client, self.redis_client = self.redis_client, None
+            if client is not None:
+                with suppress(Exception):
+                    await client.close()
             raise RedisManagerError("Could not connect to Redis.") from e
 
+    async def _load_scripts(self) -> None:
+        """
+        Registers the Lua scripts with SCRIPT LOAD and caches their SHA-1s,
+        so they are always invoked by EVALSHA without shipping their source.
+        """
+        for name, script in SCRIPTS.items():
+            self._scripts[name] = await self.redis_client.script_load(script)
+
+    async def _update_status(self, task_id: str, status: str, result) -> int:
+        """
+        Runs the update-status script for one task. If the server has lost
+        the script (restart, failover), it is loaded again and retried once.
+        """
+        args = (1, task_id, status, dumps(result))
+        try:
+            return await self.redis_client.evalsha(
+                self._scripts["update_status"], *args
+            )
+        except NoScriptError:
+            await self._load_scripts()
+            return await self.redis_client.evalsha(
+                self._scripts["update_status"], *args
+            )
+
+    async def _read_task(self, task_id: str) -> dict | None:
+        """
+        Reads a task, or returns None if it does not exist.
+
+        Tasks are hashes; one still stored as a JSON string by an earlier
+        version is read with GET instead.
+        """
+        try:
+            fields = await self.redis_client.hgetall(task_id)
+        except ResponseError as e:
+            if not str(e).startswith("WRONGTYPE"):
+                raise
+            value = await self.redis_client.get(task_id)
+            return None if value is None else loads(value)
+        return _decode_task(fields) if fields else None
+
     async def close(self) -> None:
         """Closes the Redis connection asynchronously."""
         if self.redis_client:
@@ -50,29 +175,45 @@ class RedisManager:
         try:
             if not self.redis_client:
                 raise RedisManagerError("Redis client is not initialized.")
-            await self.redis_client.set(task_id, json.dumps(task_data))
-            self.logger.log_info(f"Task {task_id} status saved to Redis.")
+            await self.redis_client.hset(task_id, mapping=_encode_task(task_data))
+            self.logger.log_info("Task %s status saved to Redis.", task_id)
         except Exception as e:
-            self.logger.log_error(f"Failed to save task {task_id} to Redis: {e}")
+            self.logger.log_error("Failed to save task %s to Redis: %s", task_id, e)
             self.exception_handler.handle_exception(
                 e, {"task_id": task_id, "task_data": task_data}
             )
             raise RedisManagerError(f"Error saving task {task_id} to Redis.") from e
 
+    async def set_statuses(self, tasks: dict[str, TaskData]) -> None:
+        """Stores the statuses of several tasks in one pipelined round-trip."""
+        try:
+            if not self.redis_client:
+                raise RedisManagerError("Redis client is not initialized.")
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for task_id, task_data in tasks.items():
+                    pipe.hset(task_id, mapping=_encode_task(task_data))
+                await pipe.execute()
+            self.logger.log_info("%s task statuses saved to Redis.", len(tasks))
+        except Exception as e:
+            self.logger.log_error("Failed to save tasks to Redis: %s", e)
+            self.exception_handler.handle_exception(e, {"task_ids": list(tasks)})
+            raise RedisManagerError("Error saving tasks to Redis.") from e
+
     async def get_status(self, task_id: str) -> dict | None:
         """Retrieves the status of a task from Redis asynchronously."""
         try:
             if not self.redis_client:
                 raise RedisManagerError("Redis client is not initialized.")
-            task_data_str = await self.redis_client.get(task_id)
-            if not task_data_str:
-                self.logger.log_warning(f"Task {task_id} not found in Redis.")
+            task_data = await self._read_task(task_id)
+            if task_data is None:
+                self.logger.log_warning("Task %s not found in Redis.", task_id)
                 return None
-            task_data = json.loads(task_data_str)
-            self.logger.log_info(f"Task {task_id} retrieved from Redis: {task_data}")
+            self.logger.log_info("Task %s retrieved from Redis: %s", task_id, task_data)
             return task_data
         except Exception as e:
-            self.logger.log_error(f"Failed to retrieve task {task_id} from Redis: {e}")
+            self.logger.log_error(
+                "Failed to retrieve task %s from Redis: %s", task_id, e
+            )
             self.exception_handler.handle_exception(e, {"task_id": task_id})
             raise RedisManagerError(
                 f"Error retrieving task {task_id} from Redis."
@@ -81,27 +222,86 @@ class RedisManager:
     async def update_task_status(
         self, task_id: str, status: str, result: TaskData | None = None
     ) -> None:
-        """Updates the status and result of a task in Redis asynchronously."""
+        """
+        Updates the status and result of a task in Redis asynchronously.
+
+        Only the two changed hash fields are written. The existence check and
+        the write run as one Lua script, so they cost a single round-trip.
+        """
         try:
             if not self.redis_client:
                 raise RedisManagerError("Redis client is not initialized.")
-            task_data_str = await self.redis_client.get(task_id)
-            if not task_data_str:
+            updated = await self._update_status(task_id, status, result)
+            if not updated:
                 raise RedisManagerError(f"Task {task_id} not found in Redis.")
-            task_data = json.loads(task_data_str)
-            task_data["status"] = status
-            task_data["result"] = result
-            await self.redis_client.set(task_id, json.dumps(task_data))
             self.logger.log_info(
-                f"Task {task_id} updated in Redis with status '{status}'."
+                "Task %s updated in Redis with status '%s'.", task_id, status
             )
         except Exception as e:
-            self.logger.log_error(f"Failed to update task {task_id} in Redis: {e}")
+            self.logger.log_error("Failed to update task %s in Redis: %s", task_id, e)
             self.exception_handler.handle_exception(
                 e, {"task_id": task_id, "status": status, "result": result}
             )
             raise RedisManagerError(f"Error updating task {task_id} in Redis.") from e
 
+    async def update_task_statuses(
+        self, updates: list[tuple[str, str, dict | None]]
+    ) -> list[bool]:
+        """
+        Updates the status and result of several tasks in one pipelined round-trip.
+
+        :param updates: (task_id, status, result) tuples.
+        :return: Whether each task was updated; False if it was missing or failed.
+        """
+        try:
+            if not self.redis_client:
+                raise RedisManagerError("Redis client is not initialized.")
+            replies = await self._update_statuses(updates)
+        except Exception as e:
+            self.logger.log_error("Failed to update tasks in Redis: %s", e)
+            self.exception_handler.handle_exception(
+                e, {"task_ids": [task_id for task_id, _, _ in updates]}
+            )
+            raise RedisManagerError("Error updating tasks in Redis.") from e
+
+        updated = []
+        for (task_id, status, _), reply in zip(updates, replies):
+            if isinstance(reply, Exception) or not reply:
+                self.logger.log_error(
+                    "Failed to update task %s in Redis: %s",
+                    task_id,
+                    reply if isinstance(reply, Exception) else "not found",
+                )
+                updated.append(False)
+            else:
+                self.logger.log_info(
+                    "Task %s updated in Redis with status '%s'.", task_id, status
+                )
+                updated.append(True)
+        return updated
+
+    async def _update_statuses(
+        self, updates: list[tuple[str, str, dict | None]]
+    ) -> list:
+        """
+        Runs the update-status script for several tasks in one pipeline and
+        returns the raw replies, errors included. If the server has lost the
+        script, it is loaded again and the pipeline retried once.
+        """
+
+        async def run() -> list:
+            sha = self._scripts["update_status"]
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for task_id, status, result in updates:
+                    pipe.evalsha(sha, 1, task_id, status, dumps(result))
+                return await pipe.execute(raise_on_error=False)
+
+        replies = await run()
+        if any(isinstance(reply, NoScriptError) for reply in replies):
+            await self._load_scripts()
+            replies = await run()
+        return replies
+
     async def delete_task(self, task_id: str) -> None:
         """Deletes a task from Redis asynchronously."""
         try:
@@ -109,12 +309,12 @@ class RedisManager:
                 raise RedisManagerError("Redis client is not initialized.")
             result = await self.redis_client.delete(task_id)
             if result == 1:
-                self.logger.log_info(f"Task {task_id} deleted from Redis.")
+                self.logger.log_info("Task %s deleted from Redis.", task_id)
             else:
                 self.logger.log_warning(
-                    f"Task {task_id} not found in Redis during deletion."
+                    "Task %s not found in Redis during deletion.", task_id
                 )
         except Exception as e:
-            self.logger.log_error(f"Failed to delete task {task_id} from Redis: {e}")
+            self.logger.log_error("Failed to delete task %s from Redis: %s", task_id, e)
             self.exception_handler.handle_exception(e, {"task_id": task_id})
             raise RedisManagerError(f"Error deleting task {task_id} from Redis.") from e
@@ -1,7 +1,16 @@
+import asyncio
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
 from core.redis_manager import RedisManager
 from core.rabbit_publisher import RabbitMQPublisher
 from modules.alert_handler import AlertHandler, AlertDestination
-from json import loads
+from modules.logger import Logger, LogLevel
+from utils.serialization import loads
+
+# Upper bound on results whose Redis updates share one pipelined round-trip
+RESULT_BATCH_SIZE = 64
+# Unacked results the broker may push ahead; room for the next batch to
+# arrive while the current one is being stored
+RESULT_PREFETCH = 2 * RESULT_BATCH_SIZE
 
 
 class ResultProcessor:
@@ -10,65 +19,118 @@ class ResultProcessor:
     """
 
     def __init__(
-        self, rabbit_config_path: str, redis_config_path: str, alert_config: dict
+        self,
+        rabbit_publisher: RabbitMQPublisher,
+        redis_manager: RedisManager,
+        alert_config: dict,
     ):
-        self.redis_manager = RedisManager(redis_config_path)
-        self.rabbit_publisher = RabbitMQPublisher(rabbit_config_path)
+        """
+        :param rabbit_publisher: RabbitMQ client, typically shared with the API.
+        :param redis_manager:    Redis client, typically shared with the API.
+        :param alert_config:     Configuration for the AlertHandler.
+        """
+        self.redis_manager = redis_manager
+        self.rabbit_publisher = rabbit_publisher
         self.alert_handler = AlertHandler.get_instance(alert_config)
         self.result_queue = "crawler.result"
+        self.channel: AbstractChannel | None = None
+        self.result_q: AbstractQueue | None = None
+        self.logger = Logger
+        self.logger.configure_logger(name="ResultProcessor", level=LogLevel.INFO)
 
     async def connect(self):
         """
-        Establishes connections to RabbitMQ and Redis.
+        Establishes connections to RabbitMQ and Redis, unless already connected,
+        and declares the result queue on a channel of its own.
         """
-        await self.rabbit_publisher.connect()
-        await self.redis_manager.connect()
+        if not self.rabbit_publisher.connected:
+            await self.rabbit_publisher.connect()
+        if not self.redis_manager.connected:
+            await self.redis_manager.connect()
+        self.channel = await self.rabbit_publisher.open_channel(RESULT_PREFETCH)
+        self.result_q = await self.channel.declare_queue(
+            self.result_queue, durable=True
+        )
 
     async def process_results(self):
         """
         Processes results from the RabbitMQ result queue asynchronously.
+
+        Results that arrived while the previous batch was being handled are
+        processed together (up to RESULT_BATCH_SIZE), so their Redis updates
+        share one pipelined round-trip. A lone result is never held back.
         """
-        queue = await self.rabbit_publisher.channel.declare_queue(
-            self.result_queue, durable=True
-        )
+        if self.result_q is None:
+            await self.connect()
+
+        pending: asyncio.Queue[AbstractIncomingMessage] = asyncio.Queue()
+        await self.result_q.consume(pending.put)
+
+        while True:
+            batch = [await pending.get()]
+            while len(batch) < RESULT_BATCH_SIZE and not pending.empty():
+                batch.append(pending.get_nowait())
+            await self._process_batch(batch)
+
+    async def _process_batch(self, batch: list[AbstractIncomingMessage]) -> None:
+        """
+        Stores a batch of results in Redis, sends their alerts and acks them
+        with a single cumulative ack.
+
+        :param batch: Result messages in delivery order.
+        """
+        updates = []
+        for message in batch:
+            try:
+                result_data = loads(message.body)
+                task_id = result_data.get("task_id")
+                status = result_data.get("status")
+                result = result_data.get("result")
+
+                if not task_id or not status:
+                    raise ValueError(
+                        "Invalid task data: Missing 'task_id' or 'status'."
+                    )
+                updates.append((task_id, status, result))
+            except Exception as e:
+                self.logger.log_exception("Error processing result: %s", e)
+
+        updated = [False] * len(updates)
+        if updates:
+            try:
+                updated = await self.redis_manager.update_task_statuses(updates)
+            except Exception as e:
+                self.logger.log_exception("Error processing results: %s", e)
+
+        for (task_id, status, _), ok in zip(updates, updated):
+            if not ok:
+                continue
+            try:
+                # Send alerts based on task status
+                message_text = (
+                    f"Task {task_id} completed successfully."
+                    if status == "completed"
+                    else f"Task {task_id} failed."
+                )
+                await self.alert_handler.send_alert(
+                    AlertDestination.TELEGRAM, message_text
+                )
+                await self.alert_handler.send_alert(
+                    AlertDestination.LOGGING, message_text
+                )
+            except Exception as e:
+                self.logger.log_exception("Error processing result: %s", e)
 
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                async with message.process():
-                    try:
-                        result_data = loads(message.body)
-                        task_id = result_data.get("task_id")
-                        status = result_data.get("status")
-                        result = result_data.get("result")
-
-                        if not task_id or not status:
-                            raise ValueError(
-                                "Invalid task data: Missing 'task_id' or 'status'."
-                            )
-
-                        await self.redis_manager.update_task_status(
-                            task_id, status, result
-                        )
-
-                        # Send alerts based on task status
-                        message_text = (
-                            f"Task {task_id} completed successfully."
-                            if status == "completed"
-                            else f"Task {task_id} failed."
-                        )
-                        await self.alert_handler.send_alert(
-                            AlertDestination.TELEGRAM, message_text
-                        )
-                        await self.alert_handler.send_alert(
-                            AlertDestination.LOGGING, message_text
-                        )
-
-                    except Exception as e:
-                        print(f"Error processing result: {e}")
+        # Deliveries arrive in order and the channel is this consumer's own,
+        # so the last one acks exactly the whole batch
+        await batch[-1].ack(multiple=True)
 
     async def close(self):
         """
-        Closes connections to RabbitMQ and Redis.
+        Closes the channel this consumer opened. The shared RabbitMQ and Redis
+        clients are closed by their owner.
         """
-        await self.rabbit_publisher.close_connection()
-        await self.redis_manager.close()
+        if self.channel is not None:
+            await self.channel.close()
+            self.channel = None
+            self.result_q = None
@@ -1,10 +1,14 @@
 import uuid
+import asyncio
 from typing import cast
 from utils.types import TaskData
 from core.redis_manager import RedisManager
 from core.rabbit_publisher import RabbitMQPublisher
 from modules.logger import Logger, LogLevel
 
+# Keys every stored task must have
+_REQUIRED_TASK_KEYS = frozenset({"status", "keyword"})
+
 
 class TaskManagerError(Exception):
     """Base exception for TaskManager."""
@@ -35,15 +39,17 @@ class TaskManager:
     task queueing.
     """
 
-    def __init__(self, redis_config_path: str, rabbit_config_path: str):
+    def __init__(
+        self, redis_manager: RedisManager, rabbit_publisher: RabbitMQPublisher
+    ):
         """
         Initializes the TaskManager with dependencies.
 
-        :param redis_config_path: Path to the Redis configuration file.
-        :param rabbit_config_path: Path to the RabbitMQ configuration file.
+        :param redis_manager: Redis client, typically shared with the API.
+        :param rabbit_publisher: RabbitMQ client, typically shared with the API.
         """
-        self.redis_manager = RedisManager(redis_config_path)
-        self.rabbit_publisher = RabbitMQPublisher(rabbit_config_path)
+        self.redis_manager = redis_manager
+        self.rabbit_publisher = rabbit_publisher
 
         self.logger = Logger
         self.logger.configure_logger(name="TaskManager", level=LogLevel.INFO)
@@ -65,10 +71,39 @@ class TaskManager:
         await self.redis_manager.set_status(task_id, task_data)
         await self.rabbit_publisher.send_task(task_id, keyword)
         self.logger.log_info(
-            f"Task {task_id} created with keyword '{keyword}' and added to queue."
+            "Task %s created with keyword '%s' and added to queue.", task_id, keyword
         )
         return task_id
 
+    async def create_tasks(self, keywords: list[str]) -> list[str]:
+        """
+        Asynchronously creates several tasks at once and adds them to the queue.
+
+        All statuses are stored with a single Redis round-trip and the messages
+        are published concurrently, so their broker confirms overlap.
+
+        :param keywords: Keywords to be used for crawling, one task each.
+        :return: Unique task IDs, in the order of ``keywords``.
+        """
+        tasks: dict[str, TaskData] = {
+            str(uuid.uuid4()): {
+                "status": "in_progress",
+                "keyword": keyword,
+                "region": None,
+                "result": None,
+            }
+            for keyword in keywords
+        }
+        await self.redis_manager.set_statuses(tasks)
+        await asyncio.gather(
+            *(
+                self.rabbit_publisher.send_task(task_id, task_data["keyword"])
+                for task_id, task_data in tasks.items()
+            )
+        )
+        self.logger.log_info("%s tasks created and added to queue.", len(tasks))
+        return list(tasks)
+
     async def get_task_status(self, task_id: str) -> TaskData | None:
         """
         Retrieves the status of a task.
@@ -76,17 +111,17 @@ class TaskManager:
         :param task_id: Unique ID of the task.
         :return: Task status and details if found, otherwise None.
         """
-        task_status = self.redis_manager.get_status(task_id)
+        task_status = await self.redis_manager.get_status(task_id)
         if not isinstance(task_status, dict):
-            self.logger.log_warning(f"Task {task_id} not found or has invalid data.")
+            self.logger.log_warning("Task %s not found or has invalid data.", task_id)
             return None
 
         if not self._is_valid_task_data(task_status):
-            self.logger.log_error(f"Task {task_id} has invalid data.")
+            self.logger.log_error("Task %s has invalid data.", task_id)
             raise InvalidTaskDataError(f"Task {task_id} contains invalid data format.")
 
         task_data = cast(TaskData, task_status)
-        self.logger.log_debug(f"Retrieved status for task {task_id}: {task_data}")
+        self.logger.log_debug("Retrieved status for task %s: %s", task_id, task_data)
         return task_data
 
     async def update_task_status(
@@ -102,13 +137,13 @@ class TaskManager:
         task_status = await self.get_task_status(task_id)
         if task_status is None:
             self.logger.log_error(
-                f"Cannot update status for non-existent task {task_id}."
+                "Cannot update status for non-existent task %s.", task_id
             )
-            raise TaskNotFoundError(f"Task {task_id} does not exist.")
+            raise TaskNotFoundError(task_id)
 
         if not isinstance(result, (dict, type(None))):
             self.logger.log_error(
-                f"Invalid result type for task {task_id}: {type(result)}."
+                "Invalid result type for task %s: %s.", task_id, type(result)
             )
             raise InvalidTaskDataError(
                 f"Result for task {task_id} must be a dictionary or None."
@@ -121,7 +156,7 @@ class TaskManager:
             "result": result,
         }
         await self.redis_manager.set_status(task_id, task_data)
-        self.logger.log_info(f"Task {task_id} updated to status '{status}'.")
+        self.logger.log_info("Task %s updated to status '%s'.", task_id, status)
 
     def _is_valid_task_data(self, data: TaskData | dict) -> bool:
         """
@@ -130,12 +165,11 @@ class TaskManager:
         :param data: Data to validate.
         :return: True if valid, False otherwise.
         """
-        required_keys = {"status", "keyword"}
         if not isinstance(data, dict):
             return False
 
         # Check required keys
-        if not required_keys.issubset(data.keys()):
+        if not _REQUIRED_TASK_KEYS.issubset(data.keys()):
             return False
 
         # Validate types of each field
@@ -1,8 +1,17 @@
 import asyncio
+from aio_pika.abc import AbstractChannel, AbstractIncomingMessage, AbstractQueue
 from core.redis_manager import RedisManager
 from core.rabbit_publisher import RabbitMQPublisher
 from crawler.parser import TikTokLibraryParser
-from json import loads
+from modules.logger import Logger, LogLevel
+from utils.serialization import loads
+
+# Tasks processed at once, each in its own browser. Every browser costs
+# hundreds of MB, so this stays small.
+CRAWLER_CONCURRENCY = 4
+# Tasks the broker may push to this crawler; one per concurrent slot keeps the
+# slots busy and leaves the rest of the queue to other crawler processes.
+TASK_PREFETCH = CRAWLER_CONCURRENCY
 
 
 class Crawler:
@@ -10,19 +19,39 @@ class Crawler:
     Asynchronously consumes tasks from RabbitMQ, processes data, and publishes results.
     """
 
-    def __init__(self, rabbit_config_path: str, redis_config_path: str):
-        self.rabbit_publisher = RabbitMQPublisher(rabbit_config_path)
-        self.redis_manager = RedisManager(redis_config_path)
-        self.parser = TikTokLibraryParser()
+    def __init__(
+        self, rabbit_publisher: RabbitMQPublisher, redis_manager: RedisManager
+    ):
+        """
+        :param rabbit_publisher: RabbitMQ client, typically shared with the API.
+        :param redis_manager:    Redis client, typically shared with the API.
+        """
+        self.rabbit_publisher = rabbit_publisher
+        self.redis_manager = redis_manager
+        self.parser = TikTokLibraryParser(max_drivers=CRAWLER_CONCURRENCY)
+        self.logger = Logger
+        self.logger.configure_logger(name="Crawler", level=LogLevel.INFO)
         self.task_queue = "crawler.task"
         self.result_queue = "crawler.result"
+        self.channel: AbstractChannel | None = None
+        self.task_q: AbstractQueue | None = None
+        self.result_q: AbstractQueue | None = None
 
     async def connect(self):
         """
-        Establishes connections to RabbitMQ and Redis.
+        Establishes connections to RabbitMQ and Redis, unless already connected,
+        and declares the task and result queues in parallel. Tasks are consumed
+        on a channel of their own; results go out on the publishing channel.
         """
-        await self.rabbit_publisher.connect()
-        await self.redis_manager.connect()
+        if not self.rabbit_publisher.connected:
+            await self.rabbit_publisher.connect()
+        if not self.redis_manager.connected:
+            await self.redis_manager.connect()
+        self.channel = await self.rabbit_publisher.open_channel(TASK_PREFETCH)
+        self.task_q, (self.result_q,) = await asyncio.gather(
+            self.channel.declare_queue(self.task_queue, durable=True),
+            self.rabbit_publisher.declare_queues(self.result_queue),
+        )
 
     async def process_task(self, message: dict):
         """
@@ -64,23 +93,53 @@ class Crawler:
     async def consume_tasks(self):
         """
         Asynchronously consumes tasks from the RabbitMQ queue.
+
+        Up to CRAWLER_CONCURRENCY tasks are processed at once; the next
+        message is only taken once a slot is free.
         """
-        queue = await self.rabbit_publisher.channel.declare_queue(
-            self.task_queue, durable=True
-        )
+        if self.task_q is None:
+            await self.connect()
 
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                async with message.process():
-                    try:
-                        task_data = loads(message.body)
-                        await self.process_task(task_data)
-                    except Exception as e:
-                        print(f"Error processing message: {e}")
+        slots = asyncio.Semaphore(CRAWLER_CONCURRENCY)
+        running: set[asyncio.Task] = set()
+        try:
+            async with self.task_q.iterator() as queue_iter:
+                async for message in queue_iter:
+                    await slots.acquire()
+                    task = asyncio.create_task(self._run_one(message, slots))
+                    running.add(task)
+                    task.add_done_callback(running.discard)
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+
+    async def _run_one(
+        self, message: AbstractIncomingMessage, slots: asyncio.Semaphore
+    ) -> None:
+        """
+        Processes one task message, acks it and frees its concurrency slot.
+        If cancelled on shutdown, the message is requeued for another crawler.
+        """
+        try:
+            async with message.process(requeue=True):
+                try:
+                    task_data = loads(message.body)
+                    await self.process_task(task_data)
+                except Exception as e:
+                    self.logger.log_exception("Error processing message: %s", e)
+        finally:
+            slots.release()
 
     async def close(self):
         """
-        Closes connections to RabbitMQ and Redis.
+        Closes the task channel and quits the browsers once searches still
+        running in worker threads have finished with them. The shared RabbitMQ
+        and Redis clients are closed by their owner.
         """
-        await self.rabbit_publisher.close_connection()
-        await self.redis_manager.close()
+        if self.channel is not None:
+            # Unacked tasks are requeued by the broker for another crawler
+            await self.channel.close()
+            self.channel = None
+            self.task_q = None
+        await asyncio.to_thread(self.parser.close)
@@ -1,13 +1,75 @@
-from time import sleep
-from urllib.parse import urlencode
-from bs4 import BeautifulSoup
+import threading
+from contextlib import suppress
+from urllib.parse import quote_plus, urlencode
+from collections.abc import Iterator
+from lxml import etree
 from modules.logger import Logger, LogLevel
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# Longest wait for more ads to load after scrolling to the bottom
+SCROLL_PAUSE = 2
+# Upper bound on scrolling through one result page, in seconds
+SCROLL_TIMEOUT = 60
+# Characters of page source handed to the incremental HTML parser at a time
+PARSE_CHUNK_SIZE = 64 * 1024
+
+# Scrolls to the bottom and keeps following the page as it grows, entirely
+# inside the browser. A MutationObserver reacts to new content immediately;
+# the script completes once the page has not grown for `quietMs`.
+_SCROLL_UNTIL_SETTLED_JS = """
+const quietMs = arguments[0];
+const maxMs = arguments[1];
+const done = arguments[arguments.length - 1];
+let last = document.body.scrollHeight;
+let finished = false;
+let quiet;
+let observer;
+const finish = () => {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(quiet);
+    clearTimeout(cap);
+    done();
+};
+const cap = setTimeout(finish, maxMs);
+observer = new MutationObserver(() => {
+    const height = document.body.scrollHeight;
+    if (height !== last) {
+        last = height;
+        window.scrollTo(0, height);
+        clearTimeout(quiet);
+        quiet = setTimeout(finish, quietMs);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+window.scrollTo(0, last);
+quiet = setTimeout(finish, quietMs);
+"""
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains ``name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Compiled once; evaluated by libxml2 for every ad card on the page
+_IS_AD_CARD = etree.XPath(f"boolean(self::div[{_has_class('ad_card')}])")
+_AD_TITLE = etree.XPath(f"(.//span[{_has_class('ad_info_text')}])[1]")
+_FIRST_SHOWN = etree.XPath(
+    "(.//span[text()='First shown:'])[1]"
+    f"/following::span[{_has_class('ad_item_value')}][1]"
+)
+_LAST_SHOWN = etree.XPath(
+    "(.//span[text()='Last shown:'])[1]"
+    f"/following::span[{_has_class('ad_item_value')}][1]"
+)
+
 
 class TikTokLibraryParser:
     """
@@ -17,9 +79,104 @@ class TikTokLibraryParser:
 
     BASE_URL = "https://library.tiktok.com/ads"
 
-    def __init__(self):
+    def __init__(self, max_drivers: int = 1):
+        """
+        :param max_drivers: Upper bound on browsers running at once, i.e. on
+                            fetches in flight; further fetches wait for one.
+        """
         self.logger = Logger
         self.logger.configure_logger(name="TikTokLibraryParser", level=LogLevel.DEBUG)
+        self._options = self._chrome_options()
+        # Browsers are started lazily and reused for later fetches; starting
+        # Chrome costs seconds and hundreds of MB. Fetches run in worker
+        # threads, each borrowing an idle browser from the pool.
+        self._drivers: list[webdriver.Chrome] = []
+        self._idle_drivers: list[webdriver.Chrome] = []
+        self._max_drivers = max_drivers
+        self._driver_slots = threading.BoundedSemaphore(max_drivers)
+        self._driver_lock = threading.Lock()
+
+    @staticmethod
+    def _chrome_options() -> Options:
+        """
+        Builds the Chrome options used for every fetch.
+
+        Only the ad cards' text is parsed, so images are not downloaded, and
+        navigation returns once the DOM is ready instead of after every
+        subresource; fetch_data waits for the ad cards explicitly.
+        """
+        options = Options()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")  # Required for running in Docker
+        options.add_argument(
+            "--disable-dev-shm-usage"
+        )  # To handle shared memory issues
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-software-rasterizer")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.page_load_strategy = "eager"
+        return options
+
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """
+        Borrows an idle Chrome driver, starting a new one if none is idle.
+        Blocks while max_drivers drivers are in use.
+        """
+        self._driver_slots.acquire()
+        try:
+            with self._driver_lock:
+                if self._idle_drivers:
+                    return self._idle_drivers.pop()
+            driver = webdriver.Chrome(options=self._options)
+            driver.set_script_timeout(SCROLL_TIMEOUT + SCROLL_PAUSE)
+            with self._driver_lock:
+                self._drivers.append(driver)
+            return driver
+        except BaseException:
+            self._driver_slots.release()
+            raise
+
+    def _release_driver(self, driver: webdriver.Chrome, broken: bool) -> None:
+        """
+        Returns a borrowed driver to the pool.
+
+        :param driver: Driver obtained from _acquire_driver.
+        :param broken: Whether the browser may have crashed; it is quit
+                       instead of reused, and a fresh one is started next time.
+        """
+        try:
+            if broken:
+                with self._driver_lock:
+                    self._drivers.remove(driver)
+                with suppress(WebDriverException):
+                    driver.quit()
+            else:
+                # Do not let one task's session state leak into the next
+                with suppress(WebDriverException):
+                    driver.delete_all_cookies()
+                with self._driver_lock:
+                    self._idle_drivers.append(driver)
+        finally:
+            self._driver_slots.release()
+
+    def close(self) -> None:
+        """
+        Quits every Chrome driver started by this parser, after waiting for
+        fetches still using one to return it.
+        """
+        # Holding every slot means no driver is borrowed. A fetch runs in a
+        # worker thread, which keeps going when the awaiting task is cancelled.
+        for _ in range(self._max_drivers):
+            self._driver_slots.acquire()
+        try:
+            with self._driver_lock:
+                drivers, self._drivers, self._idle_drivers = self._drivers, [], []
+            for driver in drivers:
+                with suppress(WebDriverException):
+                    driver.quit()
+        finally:
+            for _ in range(self._max_drivers):
+                self._driver_slots.release()
 
     def build_query(self, region: str, adv_name: str, **kwargs) -> str:
         """
@@ -30,15 +187,23 @@ class TikTokLibraryParser:
         :param kwargs: Optional parameters for the query (e.g., start_time, end_time, sort_type, etc.).
         :return: Constructed URL for the TikTok Library search.
         """
-        # Define mandatory parameters
-        query_params = {"region": region, "adv_name": adv_name}
+        if not kwargs:
+            # Common case: quote the two mandatory values directly, exactly as
+            # urlencode would, without building and walking a dict
+            url = (
+                f"{self.BASE_URL}?region={quote_plus(region)}"
+                f"&adv_name={quote_plus(adv_name)}"
+            )
+        else:
+            # Define mandatory parameters
+            query_params = {"region": region, "adv_name": adv_name}
 
-        # Add optional parameters if provided
-        query_params.update({k: v for k, v in kwargs.items() if v is not None})
+            # Add optional parameters if provided
+            query_params.update({k: v for k, v in kwargs.items() if v is not None})
 
-        # Encode the query parameters into a URL
-        url = f"{self.BASE_URL}?{urlencode(query_params)}"
-        self.logger.log_debug(f"Constructed URL: {url}")
+            # Encode the query parameters into a URL
+            url = f"{self.BASE_URL}?{urlencode(query_params)}"
+        self.logger.log_debug("Constructed URL: %s", url)
         return url
 
     def fetch_data(self, url: str) -> str:
@@ -48,44 +213,75 @@ class TikTokLibraryParser:
         :param url: The URL of the TikTok Library search page.
         :return: HTML content of the page as a string.
         """
-        self.logger.log_info(f"Fetching data from URL: {url}")
+        self.logger.log_info("Fetching data from URL: %s", url)
 
-        options = Options()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")  # Required for running in Docker
-        options.add_argument(
-            "--disable-dev-shm-usage"
-        )  # To handle shared memory issues
-        options.add_argument("--disable-gpu")
-        options.add_argument("--disable-software-rasterizer")
-        driver = webdriver.Chrome(options=options)
+        driver = self._acquire_driver()
+        broken = False
         try:
             driver.get(url)
 
-            # Scroll until the page is fully loaded
-            SCROLL_PAUSE = 2
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            while True:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                sleep(SCROLL_PAUSE)
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
-                    break
-                last_height = new_height
-
             WebDriverWait(driver, 10).until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".ad_card"))
             )
 
+            # Scroll until no more ads are loaded
+            driver.execute_async_script(
+                _SCROLL_UNTIL_SETTLED_JS, SCROLL_PAUSE * 1000, SCROLL_TIMEOUT * 1000
+            )
+
             page_source = driver.page_source
+        except TimeoutException as e:
+            self.logger.log_error("Error fetching data from URL: %s", e)
+            raise
         except Exception as e:
-            self.logger.log_error(f"Error fetching data from URL: {e}")
+            self.logger.log_error("Error fetching data from URL: %s", e)
+            broken = True
             raise
         finally:
-            driver.quit()
+            self._release_driver(driver, broken)
 
         return page_source
 
+    def iter_ads(self, html_content: str) -> Iterator[dict]:
+        """
+        Incrementally parses HTML content, yielding each advertisement as
+        soon as its ad card has been parsed.
+
+        Every ad card is discarded once its details are extracted, so the
+        parse tree never holds more than the card being read instead of the
+        whole page.
+
+        :param html_content: HTML content fetched from TikTok Library.
+        :return: Iterator over parsed advertisements.
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="div")
+        for start in range(0, len(html_content), PARSE_CHUNK_SIZE):
+            stop = start + PARSE_CHUNK_SIZE
+            parser.feed(html_content[start:stop])
+            yield from self._read_ad_cards(parser)
+        parser.close()
+        yield from self._read_ad_cards(parser)
+
+    def _read_ad_cards(self, parser: etree.HTMLPullParser) -> Iterator[dict]:
+        """
+        Yields the ad cards completed since the last call and frees them.
+
+        :param parser: Pull parser that has been fed part of the page.
+        """
+        for _, element in parser.read_events():
+            if not _IS_AD_CARD(element):
+                continue
+            yield {
+                "title": self._first_text(_AD_TITLE(element)),
+                "start_date": self._first_text(_FIRST_SHOWN(element)),
+                "end_date": self._first_text(_LAST_SHOWN(element)),
+            }
+            element.clear(keep_tail=True)
+            # Drop earlier siblings too; they have been fully read already
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
+
     def parse_data(self, html_content: str) -> list[dict]:
         """
         Parses HTML content to extract advertisement details.
@@ -93,35 +289,18 @@ class TikTokLibraryParser:
         :param html_content: HTML content fetched from TikTok Library.
         :return: List of parsed advertisements.
         """
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        ads = []
-        ad_cards = soup.find_all("div", class_="ad_card")
-        for ad_card in ad_cards:
-            title_element = ad_card.find("span", class_="ad_info_text")
-            start_date_element = ad_card.find("span", string="First shown:").find_next(
-                "span", class_="ad_item_value"
-            )
-            end_date_element = ad_card.find("span", string="Last shown:").find_next(
-                "span", class_="ad_item_value"
-            )
+        ads = list(self.iter_ads(html_content))
+        self.logger.log_info("Parsed %s ads from the page.", len(ads))
+        return ads
 
-            title = title_element.text.strip() if title_element else "N/A"
-            start_date = (
-                start_date_element.text.strip() if start_date_element else "N/A"
-            )
-            end_date = end_date_element.text.strip() if end_date_element else "N/A"
-
-            ads.append(
-                {
-                    "title": title,
-                    "start_date": start_date,
-                    "end_date": end_date,
-                }
-            )
+    @staticmethod
+    def _first_text(elements: list) -> str:
+        """
+        Returns the stripped text of the first matched element, or "N/A".
 
-        self.logger.log_info(f"Parsed {len(ads)} ads from the page.")
-        return ads
+        :param elements: Result of an XPath element query.
+        """
+        return "".join(elements[0].itertext()).strip() if elements else "N/A"
 
     def search_ads(self, region: str, adv_name: str, **kwargs) -> list[dict]:
         """
@@ -137,5 +316,5 @@ class TikTokLibraryParser:
             html_content = self.fetch_data(url)
             return self.parse_data(html_content)
         except Exception as e:
-            self.logger.log_error(f"Error during search: {e}")
+            self.logger.log_error("Error during search: %s", e)
             return []
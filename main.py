@@ -1,60 +1,91 @@
-import sys
 import signal
-import multiprocessing
+import asyncio
+import traceback
+from hypercorn.asyncio import serve
+from hypercorn.config import Config as HypercornConfig
 from api.app import create_app
+from api.routes import RABBIT_PUBLISHER, REDIS_MANAGER
 from crawler.crawler import Crawler
 from configs.config_loader import ConfigLoader
+from modules.logger import Logger
 
+try:
+    # libuv-based event loop, noticeably faster than the default asyncio loop
+    import uvloop
+except ImportError:
+    uvloop = None
 
-def run_quart():
+
+async def run_quart(shutdown_trigger):
     config = ConfigLoader.load_config("configs/config.yaml")
     app_settings = config.get("app", {})
     host = app_settings.get("host", "0.0.0.0")
     port = app_settings.get("port", 8000)
 
-    app = create_app()
-    app.run(host=host, port=port, debug=False)
-
-
-def run_crawler():
-    import asyncio
+    hypercorn_config = HypercornConfig()
+    hypercorn_config.bind = [f"{host}:{port}"]
 
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    app = create_app()
+    await serve(app, hypercorn_config, shutdown_trigger=shutdown_trigger)
 
-    crawler = Crawler("configs/rabbitmq.yaml", "configs/config.yaml")
 
-    async def consume():
+async def run_crawler():
+    crawler = Crawler(RABBIT_PUBLISHER, REDIS_MANAGER)
+    try:
         await crawler.connect()
         await crawler.consume_tasks()
-
+    finally:
+        await crawler.close()
+
+
+async def run():
+    """
+    Serves the API and consumes crawl tasks on one event loop.
+
+    Both sides are I/O-bound (blocking browser work runs in worker threads),
+    so they share a process instead of running in two.
+    """
+    shutdown = asyncio.Event()
+
+    def handle_shutdown():
+        print("\nReceived shutdown signal. Stopping...")
+        shutdown.set()
+
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, handle_shutdown)
+    loop.add_signal_handler(signal.SIGTERM, handle_shutdown)
+
+    # The API and the crawler share one RabbitMQ and one Redis client; connect
+    # them up front so that neither side opens a second connection.
+    await RABBIT_PUBLISHER.connect()
+    await REDIS_MANAGER.connect()
+
+    def handle_crawler_done(task: asyncio.Task):
+        # Without a consumer the API would keep queueing tasks nobody runs
+        if task.cancelled() or task.exception() is None:
+            return
+        Logger.log_error(
+            "Crawler stopped unexpectedly, shutting down:\n%s",
+            "".join(traceback.format_exception(task.exception())),
+        )
+        shutdown.set()
+
+    crawler_task = asyncio.create_task(run_crawler())
+    crawler_task.add_done_callback(handle_crawler_done)
     try:
-        loop.run_until_complete(consume())
+        await run_quart(shutdown.wait)
     finally:
-        loop.close()
+        crawler_task.cancel()
+        await asyncio.gather(crawler_task, return_exceptions=True)
+        await RABBIT_PUBLISHER.close_connection()
+        await REDIS_MANAGER.close()
 
 
 def main():
-    quart_proc = multiprocessing.Process(target=run_quart)
-    crawler_proc = multiprocessing.Process(target=run_crawler)
-
-    quart_proc.start()
-    crawler_proc.start()
-
-    def handle_sigint(sig, frame):
-        print("\nReceived Ctrl+C (SIGINT). Stopping processes...")
-        quart_proc.terminate()
-        crawler_proc.terminate()
-        quart_proc.join()
-        crawler_proc.join()
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, handle_sigint)
-    signal.signal(signal.SIGTERM, handle_sigint)
-
-    # Wait for the processes (blocking)
-    quart_proc.join()
-    crawler_proc.join()
+    if uvloop is not None:
+        uvloop.run(run())
+    else:
+        asyncio.run(run())
 
 
 if __name__ == "__main__":
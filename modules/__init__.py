@@ -1,5 +1,29 @@
-from .alert_handler import __all__ as alert_handler_all
-from .exception_handler import __all__ as exception_handler_all
-from .logger import __all__ as logger_all
+import importlib
 
-__all__ = alert_handler_all + exception_handler_all + logger_all  # type: ignore
+# Subpackage -> names it exports. Subpackages are imported on first attribute
+# access (PEP 562), so importing e.g. modules.logger does not pull in aiohttp.
+_EXPORTS = {
+    "alert_handler": ("AlertDestination", "AlertHandler"),
+    "exception_handler": ("ExceptionHandler",),
+    "logger": (
+        "LogLevel",
+        "LogLevelException",
+        "LogLevelValidationError",
+        "Logger",
+        "LoggerError",
+        "LoggerConfigError",
+        "LoggerFileError",
+    ),
+}
+_SOURCES = {name: package for package, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_SOURCES)
+
+
+def __getattr__(name: str):
+    package = _SOURCES.get(name)
+    if package is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{package}", __name__), name)
+    globals()[name] = value
+    return value
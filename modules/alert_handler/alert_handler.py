@@ -1,7 +1,25 @@
-import requests
+import re
+import asyncio
+import threading
+import aiohttp
+from contextlib import suppress
 from modules.logger import Logger, LogLevel
 from modules.alert_handler import AlertDestination
 
+TELEGRAM_POOL_SIZE = 32
+TELEGRAM_POOL_TIMEOUT = 10
+TELEGRAM_SOCKET_TIMEOUT = 5
+TELEGRAM_MAX_RETRIES = 2
+TELEGRAM_BACKOFF_FACTOR = 0.3
+TELEGRAM_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Service state signalling an error: any state starting with "error". The reason
+# is whatever follows the first ": " ("error: reason"), as state.split(": ", 1)
+_ERROR_RE = re.compile(r"error(?:.*?: (.*))?", re.DOTALL)
+
+# Guards the first construction of the AlertHandler singleton
+_INSTANCE_LOCK = threading.Lock()
+
 
 class AlertHandler:
     """
@@ -12,6 +30,8 @@ class AlertHandler:
     """
 
     _instance = None
+    _session: aiohttp.ClientSession | None = None
+    _session_loop: asyncio.AbstractEventLoop | None = None
 
     @staticmethod
     def get_instance(config: dict):
@@ -21,9 +41,14 @@ class AlertHandler:
         :param config: Configuration dictionary for notification channels.
         :return: The AlertHandler singleton instance.
         """
-        if AlertHandler._instance is None:
-            AlertHandler._instance = AlertHandler(config)
-        return AlertHandler._instance
+        instance = AlertHandler._instance
+        if instance is not None:
+            return instance
+        # Double-checked so that concurrent first calls construct only once
+        with _INSTANCE_LOCK:
+            if AlertHandler._instance is None:
+                AlertHandler._instance = AlertHandler(config)
+            return AlertHandler._instance
 
     def __init__(self, config: dict):
         """
@@ -37,26 +62,122 @@ class AlertHandler:
         self.logger = Logger
         self.logger.configure_logger(name="AlertHandler", level=LogLevel.INFO)
 
+        telegram_config = self.config.get("telegram", {})
+        # Resolved once: the destination does not change for the handler's lifetime
+        bot_token = telegram_config.get("bot_token")
+        chat_id = telegram_config.get("chat_id")
+        if bot_token and chat_id:
+            self._telegram_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+            self._telegram_payload = {"chat_id": chat_id}
+        else:
+            self._telegram_url = None
+            self._telegram_payload = {}
+        self.connection_pool_size = telegram_config.get(
+            "connection_pool_size", TELEGRAM_POOL_SIZE
+        )
+        pool_timeout = telegram_config.get("pool_timeout", TELEGRAM_POOL_TIMEOUT)
+        # 'connect' covers both waiting for a free pooled connection and connecting;
+        # 'total' bounds the whole request, so a slowly trickling response cannot
+        # hold a pooled connection indefinitely
+        self.telegram_timeout = aiohttp.ClientTimeout(
+            total=pool_timeout + TELEGRAM_SOCKET_TIMEOUT,
+            connect=pool_timeout,
+            sock_connect=TELEGRAM_SOCKET_TIMEOUT,
+            sock_read=TELEGRAM_SOCKET_TIMEOUT,
+        )
+
+        self._dispatch = {
+            AlertDestination.MONITORING: self._send_to_monitoring,
+            AlertDestination.TELEGRAM: self._send_to_telegram,
+            AlertDestination.LOGGING: self._log_alert,
+        }
+
+    @classmethod
+    async def _ensure_session(
+        cls, pool_size: int = TELEGRAM_POOL_SIZE
+    ) -> aiohttp.ClientSession:
+        """
+        Lazily creates the HTTP session dedicated to outbound alert requests.
+
+        The session is recreated if it was closed or belongs to another event loop;
+        in the latter case the old session is closed first.
+        It must not be shared with long-lived requests (e.g. Telegram long polling),
+        otherwise those could hold every pooled connection and starve alerts.
+
+        :param pool_size: Maximum number of simultaneous connections in the pool.
+        :return: The shared aiohttp client session.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._session is None or cls._session.closed or cls._session_loop is not loop:
+            if cls._session is not None and not cls._session.closed:
+                await cls._close_foreign_session(cls._session, cls._session_loop)
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=pool_size)
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    @staticmethod
+    async def _close_foreign_session(
+        session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        """
+        Closes a session created on another event loop.
+
+        :param session: The session to close.
+        :param loop: The event loop the session was created on.
+        """
+        if loop is not None and loop.is_running():
+            # Its connections belong to that loop; close them there
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # The loop has stopped, so its connections cannot be closed gracefully.
+        # Closing the connector still releases what it can and marks it closed.
+        with suppress(RuntimeError):
+            await session.close()
+
+    @classmethod
+    async def close_session(cls) -> None:
+        """Closes the shared HTTP session, if one was opened."""
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
+
     async def monitor_services(self, services: dict):
         """
         Monitors the state of services and triggers alerts if any service sends a signal.
 
+        Alerts for all errored services are sent concurrently; a failure in one
+        destination does not cancel the others, and is logged.
+
         :param services: Dictionary of services and their states.
         """
+        alerts = []
         for service_name, state in services.items():
-            if state.startswith("error"):
-                # Extract reason if provided (e.g., "error: reason")
-                reason = (
-                    state.split(": ", 1)[1] if ": " in state else "unspecified issue"
-                )
-                message = f"Service {
-                    service_name} encountered an error: {reason}."
-                self.logger.log_info(
-                    f"Sending alert [{message}] to all monitoring services"
+            match = _ERROR_RE.match(state)
+            if match is None:
+                continue
+            reason = match.group(1)
+            if reason is None:
+                reason = "unspecified issue"
+            message = f"Service {service_name} encountered an error: {reason}."
+            self.logger.log_info(
+                "Sending alert [%s] to all monitoring services", message
+            )
+            alerts.append((AlertDestination.TELEGRAM, message))
+            alerts.append((AlertDestination.LOGGING, message))
+            alerts.append((AlertDestination.MONITORING, message))
+
+        results = await asyncio.gather(
+            *(self.send_alert(destination, message) for destination, message in alerts),
+            return_exceptions=True,
+        )
+        for (destination, message), result in zip(alerts, results):
+            if isinstance(result, BaseException):
+                self.logger.log_error(
+                    "Failed to send alert [%s] to %s: %s", message, destination, result
                 )
-                await self.send_alert(AlertDestination.TELEGRAM, message)
-                await self.send_alert(AlertDestination.LOGGING, message)
-                await self.send_alert(AlertDestination.MONITORING, message)
 
     async def send_alert(self, destination: AlertDestination, message: str) -> None:
         """
@@ -65,37 +186,43 @@ class AlertHandler:
         :param destination: Alert destination from AlertDestination enum.
         :param message: Message text to be sent.
         """
-        if destination == AlertDestination.MONITORING:
-            await self._send_to_monitoring(message)
-        elif destination == AlertDestination.TELEGRAM:
-            await self._send_to_telegram(message)
-        elif destination == AlertDestination.LOGGING:
-            await self._log_alert(message)
-        else:
-            self.logger.log_error(f"Unsupported alert destination: {destination}")
+        handler = self._dispatch.get(destination)
+        if handler is None:
+            self.logger.log_error("Unsupported alert destination: %s", destination)
+            return
+        await handler(message)
 
     async def _send_to_monitoring(self, message: str) -> None:
         """Sending to monitoring services logic."""
         pass
 
     async def _send_to_telegram(self, message: str) -> None:
-        bot_token = self.config.get("telegram", {}).get("bot_token")
-        chat_id = self.config.get("telegram", {}).get("chat_id")
-        if not bot_token or not chat_id:
+        url = self._telegram_url
+        if url is None:
             self.logger.log_error("Telegram bot token or chat ID not configured.")
             return
         try:
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-            payload = {"chat_id": chat_id, "text": message}
-            self.logger.log_info(f"Sending message to Telegram: {message}")
-            response = requests.post(url, data=payload)
-            self.logger.log_info(
-                f"Telegram response: {
-                                 response.status_code} - {response.text}"
-            )
-            response.raise_for_status()
+            payload = {**self._telegram_payload, "text": message}
+            self.logger.log_info("Sending message to Telegram: %s", message)
+            session = await self._ensure_session(self.connection_pool_size)
+            for attempt in range(TELEGRAM_MAX_RETRIES + 1):
+                async with session.post(
+                    url, data=payload, timeout=self.telegram_timeout
+                ) as response:
+                    text = await response.text()
+                    self.logger.log_info(
+                        "Telegram response: %s - %s", response.status, text
+                    )
+                    if (
+                        response.status not in TELEGRAM_RETRY_STATUSES
+                        or attempt == TELEGRAM_MAX_RETRIES
+                    ):
+                        response.raise_for_status()
+                        return
+                # Retry transient failures with exponential backoff
+                await asyncio.sleep(TELEGRAM_BACKOFF_FACTOR * 2**attempt)
         except Exception as e:
-            self.logger.log_error(f"Failed to send message to Telegram: {e}")
+            self.logger.log_error("Failed to send message to Telegram: %s", e)
 
     async def _log_alert(self, message: str) -> None:
-        self.logger.log_info(f"ALERT: {message}")
+        self.logger.log_info("ALERT: %s", message)
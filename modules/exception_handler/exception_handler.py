@@ -1,5 +1,8 @@
 from modules.logger import Logger
 
+# Context keys reported as dedicated fields rather than extras
+_CONTEXT_KEYS = frozenset({"path", "method"})
+
 
 class ExceptionHandler:
     """
@@ -20,37 +23,93 @@ class ExceptionHandler:
         :return: Unified error response.
         :raises TypeError: If `exc` is not an instance of Exception or `context` is not a dictionary.
         """
-        # Make sure 'exc' is truly an Exception
+        ExceptionHandler._validate_exception(exc)
+        ExceptionHandler._validate_context(context)
+        # Formatting of the context is left to the logging framework and
+        # skipped if ERROR records are disabled
+        return ExceptionHandler._handle(exc, context, context)
+
+    @staticmethod
+    def handle_exceptions(excs: list[Exception], context: dict) -> list[dict]:
+        """
+        Handles several exceptions raised in the same context.
+
+        Equivalent to calling handle_exception for each exception, except that
+        the context is rendered for the log once for the whole batch. Every
+        item is validated before any of them is logged.
+
+        :param excs: Exceptions to handle.
+        :param context: Additional context, e.g., request details.
+        :return: Unified error responses, in the order of `excs`.
+        :raises TypeError: If an item of `excs` is not an instance of Exception or `context` is not a dictionary.
+        """
+        ExceptionHandler._validate_context(context)
+        for exc in excs:
+            ExceptionHandler._validate_exception(exc)
+
+        extras = str(context)
+        return [ExceptionHandler._handle(exc, context, extras) for exc in excs]
+
+    @staticmethod
+    def _validate_exception(exc) -> None:
+        """
+        Makes sure 'exc' is truly an Exception.
+
+        :raises TypeError: If it is not.
+        """
         if not isinstance(exc, Exception):
             raise TypeError(
                 f"`exc` must be an instance of Exception, got {type(exc).__name__}"
             )
 
-        # Make sure 'context' is a dict
+    @staticmethod
+    def _validate_context(context) -> None:
+        """
+        Makes sure 'context' is a dict.
+
+        :raises TypeError: If it is not.
+        """
         if not isinstance(context, dict):
             raise TypeError(
                 f"`context` must be a dictionary, got {type(context).__name__}"
             )
 
+    @staticmethod
+    def _handle(exc: Exception, context: dict, extras) -> dict:
+        """
+        Logs a validated exception and formats its response.
+
+        :param exc: Exception to handle.
+        :param context: Additional context, e.g., request details.
+        :param extras: The context as it is passed to the log record.
+        :return: Unified error response.
+        """
         # Provide default values if 'path' and 'method' are missing
         path = context.get("path", "N/A")
         method = context.get("method", "INTERNAL")
 
+        exc_type = type(exc).__name__
+        message = str(exc)
+
         # Log the exception with contextual info
         Logger.log_error(
-            f"Exception: {type(exc).__name__}. Message: {str(exc)}. "
-            f"Context: path={path}, method={method}, extras={context}"
+            "Exception: %s. Message: %s. Context: path=%s, method=%s, extras=%s",
+            exc_type,
+            message,
+            path,
+            method,
+            extras,
         )
 
         # Return a standardized error dictionary
         return {
             "error": {
-                "type": type(exc).__name__,
-                "message": str(exc),
+                "type": exc_type,
+                "message": message,
                 "context": {
                     "path": path,
                     "method": method,
-                    **{k: v for k, v in context.items() if k not in {"path", "method"}},
+                    **{k: v for k, v in context.items() if k not in _CONTEXT_KEYS},
                 },
             }
         }
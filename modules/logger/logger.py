@@ -1,6 +1,14 @@
 import os
+import json
+import time
+import queue
+import atexit
 import logging
+from pathlib import Path
+from types import MethodType
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.util import Finalize, register_after_fork
 from modules.logger.log_levels import LogLevel, LogLevelValidationError
 from configs.config_loader import (
     ConfigLoader,
@@ -8,6 +16,12 @@ from configs.config_loader import (
     ConfigFileFormatError,
 )
 
+# Single log file used when no path is given; built once at import
+DEFAULT_LOG_DIR = "log"
+DEFAULT_LOG_FILE = os.path.join(DEFAULT_LOG_DIR, "app.log")
+# Write buffer of the default log file; batches of records are flushed at once
+LOG_BUFFER_SIZE = 128 * 1024
+
 
 class LoggerError(Exception):
     """Base exception for Logger errors."""
@@ -27,13 +41,137 @@ class LoggerFileError(LoggerError):
     pass
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders the date and time part of %(asctime)s once per
+    second instead of calling time.strftime for every record.
+    """
+
+    _second: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        if datefmt is not None:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, formatted = self._second
+        if cached_second != second:
+            formatted = time.strftime(self.default_time_format, self.converter(second))
+            self._second = (second, formatted)
+        return self.default_msec_format % (formatted, record.msecs)
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that leaves records below ERROR in the file's write buffer
+    instead of flushing after each one. The owning listener flushes it once
+    the queued backlog has been written, so a burst of records costs one
+    write() instead of one per record.
+    """
+
+    _deferring = False
+
+    def _open(self):
+        # A buffer larger than the 8 KiB default holds bigger batches. Lines
+        # longer than the buffer are written straight through, not kept.
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._deferring = record.levelno < logging.ERROR
+        try:
+            super().emit(record)
+        finally:
+            self._deferring = False
+
+    def flush(self) -> None:
+        if not self._deferring:
+            super().flush()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler for a queue read by a listener thread in the same process.
+
+    The stock prepare() formats the whole record on the caller's thread and
+    enqueues a copy of it. Records here never leave the process and the
+    logger has no other handlers, so only the message arguments, while they
+    still hold the values they were logged with, and any traceback are
+    rendered eagerly; the record itself is enqueued, and the rest of
+    formatting happens on the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            # A queued traceback would keep every frame and its locals alive
+            # until the listener gets to the record
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes its handlers whenever it has drained the
+    queue, i.e. once per batch of records rather than once per record.
+    """
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():  # type: ignore[attr-defined]
+            for handler in self.handlers:
+                handler.flush()
+
+
+def _find_caller_for_stack_only(
+    logger: logging.Logger, stack_info: bool = False, stacklevel: int = 1
+) -> tuple:
+    """
+    Stands in for logging.Logger.findCaller on loggers whose format does not
+    show the caller, skipping the stack walk done for every record. Records
+    logged with stack_info=True still get the real lookup and their stack.
+
+    It is bound to individual logger instances rather than provided by a
+    Logger subclass: loggers come from logging.getLogger, which creates them
+    with the process-wide logger class, possibly before they are configured.
+    _detach removes it again.
+    """
+    if stack_info:
+        # Skip this frame, so the stack ends at the caller as usual
+        return logging.Logger.findCaller(logger, stack_info, stacklevel + 1)
+    return "(unknown file)", 0, "(unknown function)", None
+
+
+# Formatter shared by the handlers of every default configuration
+_FORMATTER = _CachedTimeFormatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
 class Logger:
     """
     A universal logger module that provides configurable logging capabilities.
     """
 
+    # All state lives on the class and is used through classmethods
+    __slots__ = ()
+
     _logger: logging.Logger | None = None
     _log_file: str | None = None
+    _log_dir_ready: str | None = None
+    # Logger name -> (log file, level) it was last configured with by default
+    _configured: dict[str, tuple[str, int]] = {}
+    # Logger name -> background listener that owns its file/console handlers
+    _listeners: dict[str, QueueListener] = {}
+    # Canonical form of the dictConfig configuration applied last
+    _applied_config: str | None = None
 
     @classmethod
     def _load_yaml_config(cls, config_path: str) -> dict:
@@ -54,12 +192,17 @@ class Logger:
     def _ensure_log_directory(cls) -> None:
         """
         Ensures that the log directory exists. If it doesn't, creates it.
+
+        The directory is checked only once; later calls for the same directory
+        return immediately. Removing it at runtime is not supported.
         """
         if cls._log_file:
-            directory = os.path.dirname(cls._log_file) or "log"
+            directory = os.path.dirname(cls._log_file) or DEFAULT_LOG_DIR
+            if directory == cls._log_dir_ready:
+                return
             try:
-                if not os.path.exists(directory):
-                    os.makedirs(directory, exist_ok=True)
+                # A single mkdir; an existing directory is not an error
+                Path(directory).mkdir(parents=True, exist_ok=True)
             except PermissionError as e:
                 # Re-raise as the same PermissionError to match tests expecting it
                 raise PermissionError(
@@ -70,6 +213,23 @@ class Logger:
                 raise LoggerFileError(
                     f"Failed to create log directory '{directory}': {e}"
                 ) from e
+            cls._log_dir_ready = directory
+
+    @classmethod
+    def _check_log_file(cls) -> None:
+        """
+        Checks that the log file can be opened for appending.
+
+        The file handler opens the file on the first record, on the listener
+        thread; checking here keeps a bad path failing in configure_logger.
+        """
+        path = cls._log_file
+        if os.path.isdir(path):
+            raise LoggerFileError(f"Log file '{path}' is a directory.")
+        # An existing file must be writable; a new one needs a writable directory
+        target = path if os.path.exists(path) else os.path.dirname(path) or "."
+        if not os.access(target, os.W_OK):
+            raise LoggerFileError(f"Cannot write to log file '{path}'.")
 
     @classmethod
     def _validate_log_level(cls, level: LogLevel) -> None:
@@ -84,11 +244,63 @@ class Logger:
         """
         Validates and converts the message to a string.
         """
+        if type(message) is str:
+            # The common case; nothing to convert
+            return message
         try:
             return str(message)
         except Exception as e:
             raise TypeError(f"Message cannot be converted to string: {message}") from e
 
+    @classmethod
+    def _apply_dict_config(cls, config: dict) -> None:
+        """
+        Applies a dictConfig configuration, unless it is the one applied last.
+
+        dictConfig tears down and rebuilds every handler, formatter and filter
+        it names; re-applying an identical configuration changes nothing.
+        """
+        try:
+            key = json.dumps(config, sort_keys=True, default=repr)
+        except TypeError:
+            # Keys that cannot be sorted; apply without remembering it
+            key = None
+        if key is not None and key == cls._applied_config:
+            return
+        dictConfig(config)
+        cls._applied_config = key
+
+    @classmethod
+    def _bind_configured_logger(cls, name: str, config: dict) -> None:
+        """
+        Binds the named logger after a dictConfig-based configuration.
+
+        dictConfig disables pre-existing loggers and keeps their previous level
+        and propagation, so unless the configuration names this logger
+        explicitly, it is re-enabled and left to inherit the configured level
+        and handlers.
+        """
+        cls._logger = logging.getLogger(name)
+        if name not in config.get("loggers", {}):
+            cls._logger.setLevel(logging.NOTSET)
+            cls._logger.propagate = True
+        cls._logger.disabled = False
+
+    @classmethod
+    def _configure_from_dict(cls, name: str, config: dict) -> None:
+        """
+        Applies a dictConfig configuration and binds the named logger to it.
+
+        If the logger was configured by default before, its handlers and
+        listener are removed first; otherwise it would write every record
+        through them as well as through the configured handlers.
+        """
+        if name in cls._listeners:
+            cls._detach(name)
+            cls._configured.pop(name, None)
+        cls._apply_dict_config(config)
+        cls._bind_configured_logger(name, config)
+
     @classmethod
     def configure_logger(
         cls,
@@ -121,8 +333,7 @@ class Logger:
                         "Invalid config_path: 'version' key is missing."
                     )
                 try:
-                    dictConfig(config_path)
-                    cls._logger = logging.getLogger(name)
+                    cls._configure_from_dict(name, config_path)
                     return
                 except Exception as e:
                     raise LoggerConfigError(
@@ -137,8 +348,7 @@ class Logger:
                             "Invalid config_path: 'version' key is missing."
                         )
 
-                    dictConfig(config)
-                    cls._logger = logging.getLogger(name)
+                    cls._configure_from_dict(name, config)
                     return
                 except Exception as e:
                     raise LoggerConfigError(
@@ -151,71 +361,196 @@ class Logger:
         # If no config_path was provided or it was None, use a default config
         # to ensure only ONE file is created, remove the timestamp approach:
         if cls._log_file is None:
-            cls._log_file = os.path.join("log", "app.log")
+            cls._log_file = DEFAULT_LOG_FILE
+
+        # Components configure their logger on every init; only the first call
+        # with given settings installs handlers, later ones just rebind it.
+        logger = logging.getLogger(name)
+        settings = (cls._log_file, level.value)
+        if cls._configured.get(name) == settings:
+            cls._logger = logger
+            return
 
         cls._ensure_log_directory()
+        cls._check_log_file()
 
-        # Create file handler
-        file_handler = logging.FileHandler(cls._log_file)
+        # Create file handler; the file is opened by the first record written
+        file_handler = _BufferedFileHandler(cls._log_file, delay=True)
         file_handler.setLevel(level.value)
 
         # Create console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level.value)
 
-        # Common formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        file_handler.setFormatter(_FORMATTER)
+        console_handler.setFormatter(_FORMATTER)
+
+        # Replace the handlers of a previous configuration instead of stacking them
+        cls._detach(name)
+
+        # Callers only enqueue records; file and console I/O happens on the
+        # listener thread, off the (possibly asyncio) caller thread.
+        records: queue.Queue = queue.Queue()
+        listener = _BatchingQueueListener(
+            records, file_handler, console_handler, respect_handler_level=True
+        )
+        listener.start()
+
+        logger.setLevel(level.value)
+        logger.addHandler(_InProcessQueueHandler(records))
+        # The logger has its own handlers; do not also walk up to the root's
+        logger.propagate = False
+        # Nor look up the caller of every record; _FORMATTER does not show it
+        logger.findCaller = MethodType(  # type: ignore[method-assign]
+            _find_caller_for_stack_only, logger
         )
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
 
-        cls._logger = logging.getLogger(name)
-        cls._logger.setLevel(level.value)
-        cls._logger.addHandler(file_handler)
-        cls._logger.addHandler(console_handler)
+        cls._listeners[name] = listener
+        cls._configured[name] = settings
+        cls._logger = logger
 
     @classmethod
-    def log(cls, message, level: LogLevel) -> None:
+    def _detach(cls, name: str) -> None:
         """
-        Logs a message at the specified log level.
+        Detaches and closes the handlers of the named logger, stopping its
+        listener after it has written every queued record.
+        """
+        logger = logging.getLogger(name)
+        for handler in logger.handlers[:]:
+            if not isinstance(handler, _InProcessQueueHandler):
+                # Installed by dictConfig; applying the same configuration
+                # again must not be skipped, or the handler stays lost
+                cls._applied_config = None
+            logger.removeHandler(handler)
+            handler.close()
+        vars(logger).pop("findCaller", None)
+
+        listener = cls._listeners.pop(name, None)
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    @classmethod
+    def _restart_listeners(cls) -> None:
+        """
+        Restarts the listener threads in a forked child process.
+
+        Threads do not survive fork(), so each logger gets a fresh queue and
+        listener feeding the same file/console handlers.
+        """
+        for name, listener in cls._listeners.items():
+            records: queue.Queue = queue.Queue()
+            for handler in logging.getLogger(name).handlers:
+                if isinstance(handler, QueueHandler):
+                    handler.queue = records
+            restarted = _BatchingQueueListener(
+                records, *listener.handlers, respect_handler_level=True
+            )
+            restarted.start()
+            cls._listeners[name] = restarted
+
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Blocks until every queued record has been handled by the listeners.
+        """
+        for listener in cls._listeners.values():
+            listener.queue.join()  # type: ignore[attr-defined]
+
+    @classmethod
+    def reset(cls) -> None:
+        """
+        Closes the handlers installed by the default configuration and forgets
+        their configuration state, so the next configure_logger starts afresh.
+
+        A dictConfig configuration stays in effect; applying the same one again
+        is still skipped.
+        """
+        for name in list(cls._listeners):
+            cls._detach(name)
+        cls._configured.clear()
+        cls._logger = None
+        cls._log_file = None
+        cls._log_dir_ready = None
+
+    @classmethod
+    def is_enabled(cls, level: LogLevel) -> bool:
+        """
+        Checks whether a message at the given level would be logged.
+
+        Lets callers skip building expensive messages that would be dropped:
+        ``if Logger.is_enabled(LogLevel.DEBUG): Logger.log_debug(dump(state))``.
+        Plain %-style arguments need no such guard, as they are only
+        formatted for emitted records.
+        """
+        logger = cls._logger
+        return logger is not None and logger.isEnabledFor(level._value_)
+
+    @classmethod
+    def log(cls, message, level: LogLevel, *args) -> None:
         """
-        if cls._logger:
-            # Convert message to str
-            message_str = cls._validate_message(message)
+        Logs a message at the specified log level.
 
-            if level == LogLevel.INFO:
-                cls._logger.info(message_str)
-            elif level == LogLevel.DEBUG:
-                cls._logger.debug(message_str)
-            elif level == LogLevel.WARNING:
-                cls._logger.warning(message_str)
-            elif level == LogLevel.ERROR:
-                cls._logger.error(message_str)
-            elif level == LogLevel.CRITICAL:
-                cls._logger.critical(message_str)
+        Messages to an unconfigured logger or below its effective level are
+        dropped before the message is touched. Optional ``args`` are merged
+        into the message with %-formatting only when the record is actually
+        emitted, e.g. ``Logger.log_info("Task %s saved.", task_id)``.
+        """
+        logger = cls._logger
+        # _value_ is a plain attribute; Enum.value goes through a descriptor
+        value = level._value_
+        if logger is None or not logger.isEnabledFor(value):
+            return
+        logger.log(value, cls._validate_message(message), *args)
 
     @classmethod
-    def log_info(cls, message) -> None:
+    def log_info(cls, message, *args) -> None:
         """Logs an informational message."""
-        cls.log(message, LogLevel.INFO)
+        cls.log(message, LogLevel.INFO, *args)
 
     @classmethod
-    def log_debug(cls, message) -> None:
+    def log_debug(cls, message, *args) -> None:
         """Logs a debug message."""
-        cls.log(message, LogLevel.DEBUG)
+        cls.log(message, LogLevel.DEBUG, *args)
 
     @classmethod
-    def log_warning(cls, message) -> None:
+    def log_warning(cls, message, *args) -> None:
         """Logs a warning message."""
-        cls.log(message, LogLevel.WARNING)
+        cls.log(message, LogLevel.WARNING, *args)
 
     @classmethod
-    def log_error(cls, message) -> None:
+    def log_error(cls, message, *args) -> None:
         """Logs an error message."""
-        cls.log(message, LogLevel.ERROR)
+        cls.log(message, LogLevel.ERROR, *args)
+
+    @classmethod
+    def log_exception(cls, message, *args) -> None:
+        """
+        Logs an error message together with the traceback of the exception
+        currently being handled. Call it from an ``except`` block.
+        """
+        logger = cls._logger
+        if logger is None or not logger.isEnabledFor(logging.ERROR):
+            return
+        logger.log(logging.ERROR, cls._validate_message(message), *args, exc_info=True)
 
     @classmethod
-    def log_critical(cls, message) -> None:
+    def log_critical(cls, message, *args) -> None:
         """Logs a critical message."""
-        cls.log(message, LogLevel.CRITICAL)
+        cls.log(message, LogLevel.CRITICAL, *args)
+
+
+def _flush_on_worker_exit(logger_cls: type[Logger]) -> None:
+    """
+    multiprocessing workers leave via os._exit(), which skips atexit hooks,
+    so the queued records are written out by a process finalizer instead.
+    """
+    Finalize(logger_cls, logger_cls.reset, exitpriority=0)
+
+
+# Write out queued records on exit and keep logging alive in forked workers
+atexit.register(Logger.reset)
+register_after_fork(Logger, _flush_on_worker_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Logger._restart_listeners)
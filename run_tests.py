@@ -1,17 +1,24 @@
 import os
 import sys
+import importlib.util
 import pytest
 
 
 def main():
     """
     Main function to discover and run all tests recursively.
+
+    When pytest-xdist is installed, test files are spread over one worker per
+    CPU core. Each file stays on a single worker, since tests within a file
+    share logger state and log files.
     """
     # Get the root directory of the project
     root_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Run pytest on all test files recursively
     pytest_args = [root_dir]
+    if importlib.util.find_spec("xdist") is not None:
+        pytest_args += ["-n", "auto", "--dist=loadfile"]
     exit_code = pytest.main(pytest_args)
 
     # Exit with the pytest exit code
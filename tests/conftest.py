@@ -0,0 +1,18 @@
+import os
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skips tests marked 'long' unless LONG_TESTS is set, e.g. LONG_TESTS=1 pytest."""
+    if os.getenv("LONG_TESTS"):
+        return
+    skip_long = pytest.mark.skip(reason="allocates 1 GB; set LONG_TESTS=1 to run")
+    for item in items:
+        if "long" in item.keywords:
+            item.add_marker(skip_long)
+
+
+@pytest.fixture(scope="session")
+def huge_string():
+    """A 10^9-character string, allocated once and shared by the tests using it."""
+    return "x" * 10**9
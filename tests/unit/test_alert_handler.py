@@ -1,8 +1,16 @@
 import sys
+import time
+import asyncio
 import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os import getenv
-from unittest.mock import patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 from modules.alert_handler import AlertHandler, AlertDestination
+from modules.alert_handler.alert_handler import (
+    TELEGRAM_POOL_TIMEOUT,
+    TELEGRAM_SOCKET_TIMEOUT,
+)
 
 __KBOT_TOKEN = getenv("__KBOT_TOKEN", "")
 __KCHAT_ID = getenv("__KCHAT_ID", "")
@@ -13,42 +21,92 @@ if not __KBOT_TOKEN or not __KCHAT_ID:
     sys.exit(1)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     return {"telegram": {"bot_token": __KBOT_TOKEN, "chat_id": __KCHAT_ID}}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def alert_handler(mock_config):
     return AlertHandler.get_instance(mock_config)
 
 
 @pytest.mark.asyncio
-@patch("requests.post")
+@patch("aiohttp.ClientSession.post")
 async def test_send_alert_telegram_success(mock_post, alert_handler):
     """Test sending a message to Telegram successfully."""
-    mock_post.return_value.status_code = 200
-    mock_post.return_value.text = '{"ok":true}'
+    response = MagicMock(status=200)
+    response.text = AsyncMock(return_value='{"ok":true}')
+    mock_post.return_value.__aenter__.return_value = response
 
     await alert_handler.send_alert(AlertDestination.TELEGRAM, "Test message")
 
     mock_post.assert_called_once_with(
         f"https://api.telegram.org/bot{__KBOT_TOKEN}/sendMessage",
         data={"chat_id": f"{__KCHAT_ID}", "text": "Test message"},
+        timeout=ANY,
+    )
+
+
+def test_session_of_a_finished_loop_is_closed_when_replaced():
+    """Test that a session left behind by a finished event loop is closed, not leaked."""
+
+    async def ensure_and_close():
+        session = await AlertHandler._ensure_session()
+        await AlertHandler.close_session()
+        return session
+
+    with patch.object(AlertHandler, "_session", None), patch.object(
+        AlertHandler, "_session_loop", None
+    ):
+        stale = asyncio.run(AlertHandler._ensure_session())
+        fresh = asyncio.run(ensure_and_close())
+
+    assert fresh is not stale
+    assert stale.closed
+
+
+def test_telegram_timeout_has_total_deadline(alert_handler):
+    """Test that a Telegram request has an overall deadline, not only socket timeouts."""
+    assert (
+        alert_handler.telegram_timeout.total
+        == TELEGRAM_POOL_TIMEOUT + TELEGRAM_SOCKET_TIMEOUT
     )
 
 
 @pytest.mark.asyncio
-@patch("requests.post")
+@patch("asyncio.sleep", new_callable=AsyncMock)
+@patch("aiohttp.ClientSession.post")
+async def test_send_alert_telegram_retries_transient_errors(
+    mock_post, mock_sleep, alert_handler
+):
+    """Test that transient Telegram errors are retried on the shared session."""
+    unavailable = MagicMock(status=503)
+    unavailable.text = AsyncMock(return_value="Service Unavailable")
+    ok = MagicMock(status=200)
+    ok.text = AsyncMock(return_value='{"ok":true}')
+    mock_post.return_value.__aenter__.side_effect = [unavailable, ok]
+
+    await alert_handler.send_alert(AlertDestination.TELEGRAM, "Test message")
+
+    assert mock_post.call_count == 2
+    mock_sleep.assert_awaited_once()
+    unavailable.raise_for_status.assert_not_called()
+    ok.raise_for_status.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.post")
 async def test_send_alert_telegram_failure(mock_post, alert_handler):
     """Test handling failure while sending a message to Telegram."""
-    mock_post.side_effect = Exception("Telegram API failed")
+    error = Exception("Telegram API failed")
+    mock_post.side_effect = error
 
     with patch.object(alert_handler.logger, "log_error") as mock_log_error:
         await alert_handler.send_alert(AlertDestination.TELEGRAM, "Test message")
 
         mock_log_error.assert_called_with(
-            "Failed to send message to Telegram: Telegram API failed"
+            "Failed to send message to Telegram: %s", error
         )
 
 
@@ -81,6 +139,66 @@ async def test_monitor_services(mock_send_to_monitoring, alert_handler):
         )
         assert mock_send_alert.call_count == 3
 
+
+@pytest.mark.asyncio
+async def test_monitor_services_logs_failed_alerts(alert_handler):
+    """Test that an alert failing in one destination is logged, not dropped."""
+    error = RuntimeError("destination down")
+
+    async def send_alert(destination, message):
+        if destination is AlertDestination.MONITORING:
+            raise error
+
+    with patch.object(alert_handler, "send_alert", side_effect=send_alert):
+        with patch.object(alert_handler.logger, "log_error") as mock_log_error:
+            await alert_handler.monitor_services({"service_a": "error: disk full"})
+
+    mock_log_error.assert_called_once_with(
+        "Failed to send alert [%s] to %s: %s",
+        "Service service_a encountered an error: disk full.",
+        AlertDestination.MONITORING,
+        error,
+    )
+
+
+@pytest.mark.asyncio
+async def test_monitor_services_error_without_reason(alert_handler):
+    """Test that an error state without a reason is reported as unspecified."""
+    services_state = {"service_a": "ok", "service_b": "error"}
+
+    with patch.object(alert_handler, "send_alert") as mock_send_alert:
+        await alert_handler.monitor_services(services_state)
+
+        mock_send_alert.assert_any_call(
+            AlertDestination.LOGGING,
+            "Service service_b encountered an error: unspecified issue.",
+        )
+        assert mock_send_alert.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "state, reason",
+    [
+        ("error", "unspecified issue"),
+        ("error: disk full", "disk full"),
+        ("errors: x", "x"),
+        ("error x: y", "y"),
+        ("error: a: b", "a: b"),
+        ("error:no space", "unspecified issue"),
+    ],
+)
+async def test_monitor_services_error_reason(alert_handler, state, reason):
+    """Test that the reason is whatever follows the first ': ' of an error state."""
+    with patch.object(alert_handler, "send_alert") as mock_send_alert:
+        await alert_handler.monitor_services({"service_a": state})
+
+        mock_send_alert.assert_any_call(
+            AlertDestination.LOGGING,
+            f"Service service_a encountered an error: {reason}.",
+        )
+
+
 @pytest.mark.asyncio
 async def test_monitor_services_with_real_send(alert_handler):
     """Test monitoring services and sending real alerts with multiple services."""
@@ -113,24 +231,30 @@ async def test_monitor_services_with_real_send(alert_handler):
 
         # Verify that logs contain alerts for services with errors
         mock_log_info.assert_any_call(
-            "Sending message to Telegram: Service service_3 encountered an error: database connection lost."
+            "Sending message to Telegram: %s",
+            "Service service_3 encountered an error: database connection lost.",
         )
         mock_log_info.assert_any_call(
-            "ALERT: Service service_3 encountered an error: database connection lost."
+            "ALERT: %s",
+            "Service service_3 encountered an error: database connection lost.",
         )
 
         mock_log_info.assert_any_call(
-            "Sending message to Telegram: Service service_6 encountered an error: timeout occurred."
+            "Sending message to Telegram: %s",
+            "Service service_6 encountered an error: timeout occurred.",
         )
         mock_log_info.assert_any_call(
-            "ALERT: Service service_6 encountered an error: timeout occurred."
+            "ALERT: %s",
+            "Service service_6 encountered an error: timeout occurred.",
         )
 
         mock_log_info.assert_any_call(
-            "Sending message to Telegram: Service service_10 encountered an error: out of memory."
+            "Sending message to Telegram: %s",
+            "Service service_10 encountered an error: out of memory.",
         )
         mock_log_info.assert_any_call(
-            "ALERT: Service service_10 encountered an error: out of memory."
+            "ALERT: %s",
+            "Service service_10 encountered an error: out of memory.",
         )
 
         # Ensure the correct number of logs are created
@@ -143,11 +267,13 @@ async def test_send_alert_invalid_destination(mock_log_error, alert_handler):
     """Test handling an invalid alert destination."""
     await alert_handler.send_alert("INVALID", "Test message")
 
-    mock_log_error.assert_called_once_with("Unsupported alert destination: INVALID")
+    mock_log_error.assert_called_once_with(
+        "Unsupported alert destination: %s", "INVALID"
+    )
 
 
 @pytest.mark.asyncio
-@patch("requests.post")
+@patch("aiohttp.ClientSession.post")
 async def test_singleton_pattern(mock_post, mock_config):
     """Test that AlertHandler enforces the singleton pattern."""
     instance1 = AlertHandler.get_instance(mock_config)
@@ -156,5 +282,30 @@ async def test_singleton_pattern(mock_post, mock_config):
     assert instance1 is instance2
 
 
+def test_get_instance_is_thread_safe(mock_config):
+    """Test that concurrent first calls to get_instance construct a single instance."""
+    workers = 8
+    barrier = threading.Barrier(workers)
+    constructed = []
+
+    def slow_init(self, config):
+        constructed.append(self)
+        # Keep the first construction running while the other threads arrive
+        time.sleep(0.05)
+
+    def first_call(_):
+        barrier.wait()
+        return AlertHandler.get_instance(mock_config)
+
+    with patch.object(AlertHandler, "_instance", None), patch.object(
+        AlertHandler, "__init__", slow_init
+    ):
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            instances = list(executor.map(first_call, range(workers)))
+
+    assert len(constructed) == 1
+    assert all(instance is instances[0] for instance in instances)
+
+
 if __name__ == "__main__":
     pytest.main()
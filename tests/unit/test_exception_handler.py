@@ -1,15 +1,9 @@
-import os
 import pytest
 from unittest.mock import patch
 from modules.logger import Logger, LogLevel
 from modules.exception_handler import ExceptionHandler
 
 
-def file_cleaner(filepath: str) -> None:
-    if filepath and os.path.exists(filepath):
-        os.remove(filepath)
-
-
 def test_handle_exception_clean():
     """Test handling a standard exception with valid context."""
     exception = ValueError("This is a test exception.")
@@ -18,12 +12,14 @@ def test_handle_exception_clean():
     with patch("modules.logger.Logger.log_error") as mock_log_error:
         response = ExceptionHandler.handle_exception(exception, context)
 
-    # New expected log message that matches the new handle_exception() format
-    expected_log = (
-        f"Exception: ValueError. Message: {exception}. "
-        f"Context: path={context['path']}, method={context['method']}, extras={context}"
+    mock_log_error.assert_called_once_with(
+        "Exception: %s. Message: %s. Context: path=%s, method=%s, extras=%s",
+        "ValueError",
+        str(exception),
+        context["path"],
+        context["method"],
+        context,
     )
-    mock_log_error.assert_called_once_with(expected_log)
 
     # Validate the returned dictionary is unchanged
     assert response == {
@@ -89,9 +85,48 @@ def test_handle_exception_with_many_exceptions():
     assert mock_log_error.call_count == 1000
 
 
-def test_handle_exception_with_enormous_exceptions():
+def test_handle_exceptions_matches_handle_exception():
+    """Test the batch API logs and responds like one handle_exception per exception."""
+    context = {"path": "/stress", "method": "POST", "user": "42"}
+    exceptions = [ValueError(f"Exception {i}") for i in range(1000)]
+
+    with patch("modules.logger.Logger.log_error") as mock_log_error:
+        responses = ExceptionHandler.handle_exceptions(exceptions, context)
+
+    assert mock_log_error.call_count == 1000
+    # The context is rendered once and the same string logged for every exception
+    extras = {id(call.args[-1]) for call in mock_log_error.call_args_list}
+    assert len(extras) == 1
+    assert mock_log_error.call_args.args[-1] == str(context)
+    assert responses == [
+        ExceptionHandler.handle_exception(exception, context)
+        for exception in exceptions
+    ]
+
+
+def test_handle_exceptions_responses_do_not_share_context():
+    """Test changing the context of one batch response leaves the others intact."""
+    responses = ExceptionHandler.handle_exceptions(
+        [ValueError("first"), ValueError("second")], {"path": "/batch"}
+    )
+
+    responses[0]["error"]["context"]["path"] = "/changed"
+    assert responses[1]["error"]["context"]["path"] == "/batch"
+
+
+def test_handle_exceptions_validates_before_logging():
+    """Test an invalid item fails the batch before any exception is logged."""
+    with patch("modules.logger.Logger.log_error") as mock_log_error:
+        with pytest.raises(TypeError):
+            ExceptionHandler.handle_exceptions([ValueError("valid"), "invalid"], {})
+
+    mock_log_error.assert_not_called()
+
+
+@pytest.mark.long
+def test_handle_exception_with_enormous_exceptions(huge_string):
     """Stress test handling an exception with a enormous message."""
-    exception = RuntimeError("x" * 10**9)
+    exception = RuntimeError(huge_string)
     context = {"path": "/enormous", "method": "PUT"}
 
     with patch("modules.logger.Logger.log_error") as mock_log_error:
@@ -101,34 +136,36 @@ def test_handle_exception_with_enormous_exceptions():
     assert len(response["error"]["message"]) == 10**9
 
 
-def test_handle_exception_logs_correctly():
+def test_handle_exception_logs_correctly(tmp_path):
     """Integration test to check Logger logs exceptions correctly."""
     exception = KeyError("Integration test exception.")
     context = {"path": "/integration", "method": "PATCH"}
-    filepath = "integration.log"
+    filepath = str(tmp_path / "integration.log")
 
     Logger.configure_logger(name="TestLogger", log_file=filepath, level=LogLevel.ERROR)
 
     with patch.object(Logger, "log_error") as mock_log_error:
         ExceptionHandler.handle_exception(exception, context)
 
-    expected_log = (
-        f"Exception: KeyError. Message: {exception}. "
-        f"Context: path={context['path']}, method={context['method']}, extras={context}"
+    mock_log_error.assert_called_once_with(
+        "Exception: %s. Message: %s. Context: path=%s, method=%s, extras=%s",
+        "KeyError",
+        str(exception),
+        context["path"],
+        context["method"],
+        context,
     )
-    mock_log_error.assert_called_once_with(expected_log)
-
-    file_cleaner(filepath)
 
 
-def test_handle_exception_with_logger_file():
+def test_handle_exception_with_logger_file(tmp_path):
     """Integration test to check if logs are written to file."""
     exception = KeyError("Integration test to log into file.")
     context = {"path": "/file", "method": "DELETE"}
-    filepath = "file_test.log"
+    filepath = str(tmp_path / "file_test.log")
 
     Logger.configure_logger(name="FileLogger", log_file=filepath, level=LogLevel.ERROR)
     ExceptionHandler.handle_exception(exception, context)
+    Logger.flush()
 
     # Check log file content
     with open(filepath, "r") as log_file:
@@ -140,14 +177,12 @@ def test_handle_exception_with_logger_file():
     )
     assert expected_message in logs, f"Expected message not found in logs: {logs}"
 
-    file_cleaner(filepath)
 
-
-def test_handle_exception_with_logger_levels():
+def test_handle_exception_with_logger_levels(tmp_path):
     """Integration test to validate logging levels in Logger."""
     exception = RuntimeError("Logger level integration test.")
     context = {"path": "/levels", "method": "GET"}
-    filepath = "level_test.log"
+    filepath = str(tmp_path / "level_test.log")
 
     Logger.configure_logger(
         name="LevelLogger", log_file=filepath, level=LogLevel.WARNING
@@ -158,8 +193,6 @@ def test_handle_exception_with_logger_levels():
 
     mock_log_error.assert_called_once()
 
-    file_cleaner(filepath)
-
 
 if __name__ == "__main__":
     pytest.main()
@@ -1,18 +1,31 @@
 import os
+import sys
+import queue
+import logging
 import pytest
-from modules.logger import LogLevelValidationError, LoggerConfigError, Logger, LogLevel
+from modules.logger import (
+    LogLevelValidationError,
+    LoggerConfigError,
+    LoggerFileError,
+    Logger,
+    LogLevel,
+)
+from modules.logger.logger import (
+    _BufferedFileHandler,
+    _CachedTimeFormatter,
+    _InProcessQueueHandler,
+)
 from unittest.mock import patch
 
 
 @pytest.fixture(autouse=True)
 def reset_logger():
     # Before each test:
-    Logger._logger = None
-    Logger._log_file = None
+    Logger.reset()
     yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_yaml_config():
     """Mock YAML configuration as a dictionary."""
     return {
@@ -26,10 +39,15 @@ def mock_yaml_config():
 
 @pytest.fixture
 def configure_logger(mock_yaml_config):
-    """Fixture to configure the logger with a dictionary configuration."""
+    """
+    Fixture to configure the logger with the dictionary configuration.
+
+    The configuration is the same for every test, so dictConfig only runs for
+    the first one; later tests just bind the logger to it.
+    """
     Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
     yield
-    Logger._logger = None  # Reset logger
+    Logger.reset()
 
 
 @pytest.fixture
@@ -40,7 +58,7 @@ def configure_logger_with_dict(mock_yaml_config):
     """
     Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
     yield
-    Logger._logger = None
+    Logger.reset()
 
 
 def test_configure_logger_with_dict(mock_yaml_config):
@@ -49,91 +67,290 @@ def test_configure_logger_with_dict(mock_yaml_config):
     assert Logger._logger is not None
 
 
+@pytest.fixture
+def forget_dict_config():
+    """Makes the next dictionary configuration apply, and the one after the test."""
+    Logger._applied_config = None
+    yield
+    Logger._applied_config = None
+
+
+def test_identical_dict_config_is_applied_once(mock_yaml_config, forget_dict_config):
+    """Test that re-applying the last dictionary configuration skips dictConfig."""
+    with patch("modules.logger.logger.dictConfig") as mock_dict_config:
+        Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+        Logger.configure_logger(name="OtherLogger", config_path=mock_yaml_config)
+        assert mock_dict_config.call_count == 1
+
+        # reset() leaves the dictConfig configuration in effect
+        Logger.reset()
+        Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+        assert mock_dict_config.call_count == 1
+
+    assert Logger._logger is logging.getLogger("TestLogger")
+
+
+def test_dict_config_is_reapplied_after_its_handlers_are_detached(
+    tmp_path, forget_dict_config
+):
+    """Test a dict config is applied again once a default config replaced its handlers."""
+    config = {
+        "version": 1,
+        "handlers": {"console": {"class": "logging.StreamHandler"}},
+        "loggers": {"NamedLogger": {"handlers": ["console"]}},
+    }
+    Logger.configure_logger(name="NamedLogger", config_path=config)
+    Logger.configure_logger(name="NamedLogger", log_file=str(tmp_path / "own.log"))
+    Logger.configure_logger(name="NamedLogger", config_path=config)
+
+    handlers = logging.getLogger("NamedLogger").handlers
+    assert [type(handler) for handler in handlers] == [logging.StreamHandler]
+
+
+def test_configure_logger_is_idempotent(tmp_path):
+    """Test that repeated configuration with the same settings adds no handlers."""
+    log_file = str(tmp_path / "idempotent.log")
+    Logger.configure_logger(name="IdempotentLogger", log_file=log_file)
+    Logger.configure_logger(name="IdempotentLogger", log_file=log_file)
+
+    assert len(logging.getLogger("IdempotentLogger").handlers) == 1
+    assert len(Logger._listeners["IdempotentLogger"].handlers) == 2
+
+
+def test_reconfigure_logger_replaces_handlers(tmp_path):
+    """Test that reconfiguring a logger replaces its handlers instead of stacking."""
+    Logger.configure_logger(name="ReconfiguredLogger", log_file=str(tmp_path / "a.log"))
+    Logger.configure_logger(
+        name="ReconfiguredLogger",
+        log_file=str(tmp_path / "b.log"),
+        level=LogLevel.DEBUG,
+    )
+
+    assert len(logging.getLogger("ReconfiguredLogger").handlers) == 1
+    handlers = Logger._listeners["ReconfiguredLogger"].handlers
+    assert len(handlers) == 2
+    assert handlers[0].baseFilename == str(tmp_path / "b.log")
+
+
+def test_buffered_file_handler_flushes_only_errors(tmp_path):
+    """Test the file handler leaves records below ERROR for the listener to flush."""
+    handler = _BufferedFileHandler(str(tmp_path / "buffered.log"))
+    with patch("logging.StreamHandler.flush") as mock_flush:
+        handler.emit(logging.makeLogRecord({"levelno": logging.INFO, "msg": "info"}))
+        mock_flush.assert_not_called()
+        handler.emit(logging.makeLogRecord({"levelno": logging.ERROR, "msg": "error"}))
+        mock_flush.assert_called_once()
+    handler.close()
+
+
+def test_buffered_file_handler_writes_on_flush(tmp_path):
+    """Test records held in the file buffer reach the file when flushed."""
+    path = tmp_path / "buffered.log"
+    handler = _BufferedFileHandler(str(path), delay=True)
+    handler.emit(logging.makeLogRecord({"levelno": logging.INFO, "msg": "buffered"}))
+    assert path.read_text() == ""
+
+    handler.flush()
+    assert path.read_text() == "buffered\n"
+    handler.close()
+
+
+def test_queue_handler_enqueues_record_with_merged_message():
+    """Test records are enqueued as-is, with their arguments merged into the message."""
+    records = queue.Queue()
+    handler = _InProcessQueueHandler(records)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = logging.makeLogRecord(
+            {"msg": "Task %s failed.", "args": ("abc",), "exc_info": sys.exc_info()}
+        )
+    handler.handle(record)
+
+    queued = records.get_nowait()
+    assert queued is record
+    assert queued.msg == "Task abc failed."
+    assert queued.args is None
+    # The traceback is rendered, not kept alive on the queue
+    assert queued.exc_info is None
+    assert queued.exc_text.endswith("ValueError: boom")
+
+
+def test_cached_time_formatter_matches_default_format():
+    """Test the per-second asctime cache renders the same time as logging.Formatter."""
+    formatter = _CachedTimeFormatter()
+    first = logging.makeLogRecord({"msg": "first"})
+    second = logging.makeLogRecord({"msg": "second", "created": first.created + 0.5})
+    second.msecs = (second.created - int(second.created)) * 1000
+
+    for record in (first, second, first):
+        assert formatter.formatTime(record) == logging.Formatter().formatTime(record)
+
+
+def test_default_configuration_does_not_propagate(tmp_path, mock_yaml_config):
+    """Test default-configured loggers stop propagation until a dict config binds them."""
+    Logger.configure_logger(name="TestLogger", log_file=str(tmp_path / "own.log"))
+    assert logging.getLogger("TestLogger").propagate is False
+
+    Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+    assert logging.getLogger("TestLogger").propagate is True
+
+
+def test_dict_config_after_default_writes_records_once(tmp_path, mock_yaml_config):
+    """Test a propagating logger rebound from the default config skips its old handler."""
+    Logger.configure_logger(name="TestLogger", log_file=str(tmp_path / "own.log"))
+    Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+
+    with patch.object(logging.Handler, "handle", autospec=True) as mock_handle:
+        logging.getLogger("TestLogger").error("written once")
+
+    handlers = [call.args[0] for call in mock_handle.call_args_list]
+    assert handlers
+    assert not any(isinstance(handler, _InProcessQueueHandler) for handler in handlers)
+
+
+def test_dict_config_after_default_detaches_default_handlers(
+    tmp_path, mock_yaml_config
+):
+    """Test rebinding a default-configured logger to a dict config drops its handlers."""
+    Logger.configure_logger(name="TestLogger", log_file=str(tmp_path / "own.log"))
+    Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+
+    assert logging.getLogger("TestLogger").handlers == []
+    assert "TestLogger" not in Logger._listeners
+
+    Logger.reset()
+    assert Logger._listeners == {}
+
+
+def test_default_configuration_skips_caller_lookup(tmp_path, mock_yaml_config):
+    """Test default-configured loggers skip findCaller until a dict config binds them."""
+    Logger.configure_logger(name="TestLogger", log_file=str(tmp_path / "own.log"))
+    logger = logging.getLogger("TestLogger")
+    assert logger.findCaller() == ("(unknown file)", 0, "(unknown function)", None)
+
+    Logger.configure_logger(name="TestLogger", config_path=mock_yaml_config)
+    assert logger.findCaller()[1] > 0
+
+
+def test_default_configuration_keeps_stack_info(tmp_path):
+    """Test records logged with stack_info=True keep their caller and stack."""
+    Logger.configure_logger(name="TestLogger", log_file=str(tmp_path / "own.log"))
+
+    with patch.object(logging.Handler, "handle", autospec=True) as mock_handle:
+        logging.getLogger("TestLogger").info("with stack", stack_info=True)
+
+    record = mock_handle.call_args.args[1]
+    assert record.funcName == "test_default_configuration_keeps_stack_info"
+    # The stack ends at the logging call, not inside the logger module
+    last_frame = record.stack_info.splitlines()[-2]
+    assert last_frame.endswith("in test_default_configuration_keeps_stack_info")
+
+
 def test_invalid_config_path():
     """Test configure_logger with an invalid config_path."""
     with pytest.raises(LoggerConfigError, match="Invalid config_path"):
         Logger.configure_logger(name="TestLogger", config_path={"invalid": "data"})
 
 
+def test_is_enabled_follows_logger_level(tmp_path):
+    """Test is_enabled reports whether a level would be logged."""
+    assert not Logger.is_enabled(LogLevel.CRITICAL)
+
+    Logger.configure_logger(
+        name="EnabledLogger",
+        log_file=str(tmp_path / "enabled.log"),
+        level=LogLevel.INFO,
+    )
+    assert Logger.is_enabled(LogLevel.INFO)
+    assert Logger.is_enabled(LogLevel.ERROR)
+    assert not Logger.is_enabled(LogLevel.DEBUG)
+
+
 def test_log_info_with_valid_message(configure_logger):
     """Test log_info logs a valid informational message."""
-    with patch("logging.Logger.info") as mock_info:
+    with patch("logging.Logger.log") as mock_info:
         Logger.log("This is an informational message.", LogLevel.INFO)
-        mock_info.assert_called_once_with("This is an informational message.")
+        mock_info.assert_called_once_with(
+            logging.INFO, "This is an informational message."
+        )
 
 
 def test_log_info_without_configuring_logger():
     """Test log_info when logger is not configured."""
-    with patch("logging.Logger.info") as mock_info:
+    with patch("logging.Logger.log") as mock_info:
         Logger.log("This should not log.", LogLevel.INFO)
         mock_info.assert_not_called()
 
 
 def test_log_info_message(configure_logger_with_dict):
     """Test logging an informational message with fixture named configure_logger_with_dict."""
-    with patch("logging.Logger.info") as mock_info:
+    with patch("logging.Logger.log") as mock_info:
         Logger.log_info("This is a test message.")
-        mock_info.assert_called_once_with("This is a test message.")
-
-
-def test_log_info_with_empty_message(configure_logger):
-    """Test log_info with an empty message."""
-    with patch("logging.Logger.info") as mock_info:
-        Logger.log("", LogLevel.INFO)
-        mock_info.assert_called_once_with("")
-
-
-def test_log_info_with_large_message(configure_logger):
-    """Test log_info with a very large message."""
-    large_message = "A" * 10**6
-    with patch("logging.Logger.info") as mock_info:
-        Logger.log(large_message, LogLevel.INFO)
-        mock_info.assert_called_once_with(large_message)
-
-
-def test_log_info_with_non_string_message(configure_logger):
-    """Test log_info with a non-string message."""
-    with patch("logging.Logger.info") as mock_info:
-        # Implicit string conversion expected
-        Logger.log_info(12345)  # type: ignore
-        mock_info.assert_called_once_with("12345")
+        mock_info.assert_called_once_with(logging.INFO, "This is a test message.")
+
+
+@pytest.mark.parametrize(
+    "message, level, expected",
+    [
+        ("", LogLevel.INFO, ""),
+        ("A" * 10**6, LogLevel.INFO, "A" * 10**6),
+        (12345, LogLevel.INFO, "12345"),
+        (None, LogLevel.INFO, "None"),
+        ("", LogLevel.ERROR, ""),
+        ("E" * 10**6, LogLevel.ERROR, "E" * 10**6),
+        (3.14159, LogLevel.ERROR, "3.14159"),
+    ],
+    ids=[
+        "info-empty",
+        "info-large",
+        "info-int",
+        "info-none",
+        "error-empty",
+        "error-large",
+        "error-float",
+    ],
+)
+def test_log_message_conversion(configure_logger, message, level, expected):
+    """Test empty, large and non-string messages are logged as strings."""
+    with patch("logging.Logger.log") as mock_log:
+        Logger.log(message, level)
+        mock_log.assert_called_once_with(level.value, expected)
+
+
+def test_log_info_with_lazy_format_args(configure_logger):
+    """Test log_info forwards format arguments for lazy %-formatting."""
+    with patch("logging.Logger.log") as mock_info:
+        Logger.log_info("Task %s saved to %s.", "abc", "Redis")
+        mock_info.assert_called_once_with(
+            logging.INFO, "Task %s saved to %s.", "abc", "Redis"
+        )
 
 
 def test_log_error_with_valid_message(configure_logger):
     """Test log_error logs a valid error message."""
-    with patch("logging.Logger.error") as mock_error:
+    with patch("logging.Logger.log") as mock_error:
         Logger.log_error("This is an error message.")
-        mock_error.assert_called_once_with("This is an error message.")
+        mock_error.assert_called_once_with(logging.ERROR, "This is an error message.")
 
 
 def test_log_error_without_configuring_logger():
     """Test log_error when logger is not configured."""
-    with patch("logging.Logger.error") as mock_error:
+    with patch("logging.Logger.log") as mock_error:
         Logger.log("This should not log.", LogLevel.ERROR)
         mock_error.assert_not_called()
 
 
-def test_log_error_with_empty_message(configure_logger):
-    """Test log_error with an empty message."""
-    with patch("logging.Logger.error") as mock_error:
-        Logger.log("", LogLevel.ERROR)
-        mock_error.assert_called_once_with("")
-
-
-def test_log_error_with_large_message(configure_logger):
-    """Test log_error with a very large message."""
-    large_message = "E" * 10**6
-    with patch("logging.Logger.error") as mock_error:
-        Logger.log_error(large_message)
-        mock_error.assert_called_once_with(large_message)
-
-
-def test_log_error_with_non_string_message(configure_logger):
-    """Test log_error with a non-string message."""
-    with patch("logging.Logger.error") as mock_error:
-        # Implicit string conversion expected
-        Logger.log(3.14159, LogLevel.ERROR)  # type: ignore
-        mock_error.assert_called_once_with("3.14159")
+def test_log_exception_includes_traceback(configure_logger):
+    """Test log_exception logs an error with the active exception's traceback."""
+    with patch("logging.Logger.log") as mock_error:
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            Logger.log_exception("Failed to process %s.", "task")
+        mock_error.assert_called_once_with(
+            logging.ERROR, "Failed to process %s.", "task", exc_info=True
+        )
 
 
 def test_configure_logger_with_invalid_level():
@@ -146,21 +363,14 @@ def test_configure_logger_with_invalid_level():
         )
 
 
-def test_log_info_with_none_message(configure_logger):
-    """Test log_info with a None message."""
-    with patch("logging.Logger.info") as mock_info:
-        Logger.log(None, LogLevel.INFO)  # type: ignore
-        mock_info.assert_called_once_with("None")
-
-
 def test_log_error_with_exception_message(configure_logger):
     """Test log_error logs exception message."""
-    with patch("logging.Logger.error") as mock_error:
+    with patch("logging.Logger.log") as mock_error:
         try:
             raise ValueError("This is a test exception")
         except ValueError as e:
             Logger.log(str(e), LogLevel.ERROR)
-        mock_error.assert_called_once_with("This is a test exception")
+        mock_error.assert_called_once_with(logging.ERROR, "This is a test exception")
 
 
 def test_configure_logger_with_nonexistent_file_path():
@@ -178,20 +388,30 @@ def test_configure_logger_with_nonexistent_file_path():
         )
 
 
+def test_configure_logger_with_directory_as_log_file(tmp_path, monkeypatch):
+    """Test a log file path that cannot be opened fails at configuration time."""
+    monkeypatch.setattr(Logger, "_log_file", None)
+    monkeypatch.setattr(Logger, "_log_dir_ready", None)
+    with pytest.raises(LoggerFileError):
+        Logger.configure_logger(
+            name="TestLogger", log_file=str(tmp_path), level=LogLevel.DEBUG
+        )
+
+
 def test_log_to_unconfigured_logger():
     """Test logging to an unconfigured logger."""
     Logger._logger = None  # Ensure logger is unconfigured
-    with patch("logging.Logger.info") as mock_info:
+    with patch("logging.Logger.log") as mock_info:
         Logger.log("This log should not occur.", LogLevel.ERROR)
         mock_info.assert_not_called()
 
 
-def test_log_error_with_huge_message(configure_logger):
+@pytest.mark.long
+def test_log_error_with_huge_message(configure_logger, huge_string):
     """Test log_error with an excessively large message."""
-    huge_message = "X" * 10**9  # 1 billion characters
-    with patch("logging.Logger.error") as mock_error:
-        Logger.log(huge_message, LogLevel.ERROR)
-        mock_error.assert_called_once_with(huge_message)
+    with patch("logging.Logger.log") as mock_error:
+        Logger.log(huge_string, LogLevel.ERROR)
+        mock_error.assert_called_once_with(logging.ERROR, huge_string)
 
 
 def test_log_with_incorrect_method_call():
@@ -203,47 +423,36 @@ def test_log_with_incorrect_method_call():
 def test_log_with_binary_message(configure_logger):
     """Test logging with binary data as the message."""
     binary_message = b"This is binary data"
-    with patch("logging.Logger.info") as mock_info:
+    with patch("logging.Logger.log") as mock_info:
         # Convert binary to string
         Logger.log_info(binary_message.decode())
-        mock_info.assert_called_once_with("This is binary data")
+        mock_info.assert_called_once_with(logging.INFO, "This is binary data")
 
 
-def test_logger_creates_log_directory():
+def test_logger_creates_log_directory(tmp_path, monkeypatch):
     """Test that logger creates log/ directory if no specific log file is provided."""
+    monkeypatch.chdir(tmp_path)
     log_dir = "log"
 
-    if os.path.exists(log_dir):
-        for file in os.listdir(log_dir):
-            os.remove(os.path.join(log_dir, file))
-        os.rmdir(log_dir)
-
     Logger.configure_logger(name="TestLogger")
     assert os.path.exists(log_dir) and os.path.isdir(
         log_dir
     ), "log/ directory was not created."
 
-    for file in os.listdir(log_dir):
-        os.remove(os.path.join(log_dir, file))
-    os.rmdir(log_dir)
-
 
-def test_logger_log_directory_not_empty():
+def test_logger_log_directory_not_empty(tmp_path, monkeypatch):
     """
     Test that logger creates a log file in log/ directory when no specific log file
     is provided. We also emit at least one message to ensure the file is written.
     """
+    monkeypatch.chdir(tmp_path)
     log_dir = "log"
 
-    if os.path.exists(log_dir):
-        for file in os.listdir(log_dir):
-            os.remove(os.path.join(log_dir, file))
-        os.rmdir(log_dir)
-
     Logger.configure_logger(name="TestLogger")
 
     # Force a log message so that the file definitely gets created/written
     Logger.log_info("Ensuring file is actually created.")
+    Logger.flush()
 
     assert os.path.exists(log_dir) and os.path.isdir(
         log_dir
@@ -252,10 +461,6 @@ def test_logger_log_directory_not_empty():
         len(os.listdir(log_dir)) > 0
     ), "log/ directory is empty, log file was not created."
 
-    for file in os.listdir(log_dir):
-        os.remove(os.path.join(log_dir, file))
-    os.rmdir(log_dir)
-
 
 if __name__ == "__main__":
     pytest.main()
@@ -1,3 +1,4 @@
 from .types import TaskData
+from .serialization import dumps, loads
 
-__all__ = ["TaskData"]
+__all__ = ["TaskData", "dumps", "loads"]
@@ -0,0 +1,13 @@
+try:
+    # orjson works on bytes directly and is several times faster than json
+    from orjson import dumps, loads
+except ImportError:
+    import json
+    from json import loads  # type: ignore[assignment]
+
+    def dumps(obj) -> bytes:  # type: ignore[misc]
+        """Serialises an object to UTF-8 encoded JSON bytes."""
+        return json.dumps(obj).encode()
+
+
+__all__ = ["dumps", "loads"]